@@ -3,6 +3,7 @@
 import hashlib
 import json
 import os
+import random
 import re
 import shlex
 import shutil
@@ -53,6 +54,8 @@ SCORING_SCHEMA_VERSION = "2.0.0"
 HARBOR_TIMEOUT_BUFFER_SEC = 120
 MIN_DOCKER_COMPOSE_VERSION = (2, 40, 1)
 HARBOR_RATE_LIMIT_RETRY_DELAY_SEC = 20
+HARBOR_RATE_LIMIT_RETRY_MAX_DELAY_SEC = 120
+HARBOR_RATE_LIMIT_RETRY_JITTER_SEC = 5.0
 HARBOR_RATE_LIMIT_MAX_ATTEMPTS = 2
 PROVIDER_PROBE_TIMEOUT_SEC = 45
 PROVIDER_PROBE_OUTPUT_LIMIT = 600
@@ -66,7 +69,18 @@ HARNESS_STALE_BUILDX_PATTERN = re.compile(
     r"docker-buildx bake .*--allow fs\.read=.*harbor-task-[^/]+/environment"
 )
 HARNESS_STALE_RUN_PATTERN = re.compile(r"\bharbor run --path .*harbor-task-")
-DOCKER_COMPOSE_VERSION_PATTERN = re.compile(r"(?:^|[^0-9])v?(\d+)\.(\d+)\.(\d+)(?:[^0-9]|$)")
+PROC_ROOT = Path("/proc")
+# Every stale build/run pattern contains one of these, so plain substring checks can
+# rule out unrelated processes before any regex runs.
+HARBOR_PROCESS_MARKERS: tuple[str, ...] = ("harbor", "docker-compose-build.yaml")
+PROCESS_LISTING_LINE_PATTERN = re.compile(r"^[ \t]*(\d+)[ \t]+(\d+)[ \t]+(.*\S)", re.MULTILINE)
+DOCKER_COMPOSE_VERSION_ENV_KEYS: tuple[str, ...] = (
+    "PATH",
+    "DOCKER_HOST",
+    "DOCKER_CONTEXT",
+    "DOCKER_CONFIG",
+)
+DOCKER_COMPOSE_VERSION_PATTERN = re.compile(r"(?<!\d)(\d+)\.(\d+)\.(\d+)(?!\d)")
 DOCKERFILE_FROM_PATTERN = re.compile(
     r"^\s*FROM(?:\s+--platform=[^\s]+)?\s+([^\s]+)",
     re.IGNORECASE | re.MULTILINE,
@@ -88,21 +102,32 @@ COMMAND_EXECUTION_HINTS = (
     "passed successfully",
 )
 VERIFIED_WITH_PATTERN = re.compile(r"\bverif(?:y|ied|ying)\b.*\bwith\b")
-INLINE_SECRET_PATTERN = re.compile(
-    r"\b("
-    r"OPENAI_API_KEY|ANTHROPIC_API_KEY|CLAUDE_CODE_API_KEY|CLAUDE_CODE_OAUTH_TOKEN|"
-    r"GEMINI_API_KEY|GOOGLE_API_KEY|COPILOT_API_KEY|CURSOR_API_KEY|PI_API_KEY|"
-    r"GOOGLE_APPLICATION_CREDENTIALS"
-    r")=([^\s\"']+)"
+REDACTED_SECRET_KEYS: tuple[str, ...] = (
+    "OPENAI_API_KEY",
+    "ANTHROPIC_API_KEY",
+    "CLAUDE_CODE_API_KEY",
+    "CLAUDE_CODE_OAUTH_TOKEN",
+    "GEMINI_API_KEY",
+    "GOOGLE_API_KEY",
+    "COPILOT_API_KEY",
+    "CURSOR_API_KEY",
+    "PI_API_KEY",
+    "GOOGLE_APPLICATION_CREDENTIALS",
+)
+_SECRET_KEY_ALTERNATION = "|".join(REDACTED_SECRET_KEYS)
+_SECRET_REDACTION_SOURCE = (
+    rf"(?P<inline>\b(?P<inline_key>{_SECRET_KEY_ALTERNATION})=[^\s\"']+)"
+    rf'|(?P<json>"(?P<json_key>{_SECRET_KEY_ALTERNATION})"\s*:\s*"[^"]+")'
+    r"|(?P<token>\bsk-[A-Za-z0-9_-]{16,}\b)"
 )
-JSON_SECRET_PATTERN = re.compile(
-    r'"('
-    r"OPENAI_API_KEY|ANTHROPIC_API_KEY|CLAUDE_CODE_API_KEY|CLAUDE_CODE_OAUTH_TOKEN|"
-    r"GEMINI_API_KEY|GOOGLE_API_KEY|COPILOT_API_KEY|CURSOR_API_KEY|PI_API_KEY|"
-    r"GOOGLE_APPLICATION_CREDENTIALS"
-    r')"\s*:\s*"([^"]+)"'
+# Every redacted key or token contains one of these, so text without any of them
+# can skip the regex scan entirely.
+SECRET_REDACTION_MARKERS: tuple[str, ...] = ("_API_KEY", "_OAUTH_TOKEN", "_CREDENTIALS", "sk-")
+_SECRET_REDACTION_BYTE_MARKERS = tuple(
+    marker.encode("ascii") for marker in SECRET_REDACTION_MARKERS
 )
-KEY_LIKE_TOKEN_PATTERN = re.compile(r"\bsk-[A-Za-z0-9_-]{16,}\b")
+SECRET_REDACTION_PATTERN = re.compile(_SECRET_REDACTION_SOURCE)
+SECRET_REDACTION_BYTES_PATTERN = re.compile(_SECRET_REDACTION_SOURCE.encode("ascii"))
 SECRET_ENV_KEYS: tuple[str, ...] = (
     "OPENAI_API_KEY",
     "ANTHROPIC_API_KEY",
@@ -112,23 +137,31 @@ SECRET_ENV_KEYS: tuple[str, ...] = (
     "GOOGLE_API_KEY",
 )
 SECRET_FILE_ENV_PREFIX = "AGENTIC_EVAL_SECRET_FILE_"
-PUBLIC_REGISTRY_HOSTS: set[str] = {
-    "docker.io",
-    "index.docker.io",
-    "registry-1.docker.io",
-    "ghcr.io",
-    "quay.io",
-    "mcr.microsoft.com",
-    "public.ecr.aws",
-    "gcr.io",
-    "us.gcr.io",
-    "eu.gcr.io",
-    "asia.gcr.io",
-    "registry.k8s.io",
-}
-REGISTRY_RATE_LIMIT_PATTERN = re.compile(
-    r"(?:toomanyrequests|too many requests|pull rate limit|rate limit exceeded|429)",
-    re.IGNORECASE,
+PUBLIC_REGISTRY_HOSTS: frozenset[str] = frozenset(
+    {
+        "docker.io",
+        "index.docker.io",
+        "registry-1.docker.io",
+        "ghcr.io",
+        "quay.io",
+        "mcr.microsoft.com",
+        "public.ecr.aws",
+        "gcr.io",
+        "us.gcr.io",
+        "eu.gcr.io",
+        "asia.gcr.io",
+        "registry.k8s.io",
+    }
+)
+REGISTRY_RATE_LIMIT_SNIPPETS: tuple[str, ...] = (
+    "toomanyrequests",
+    "too many requests",
+    "pull rate limit",
+    "rate limit exceeded",
+    "429",
+)
+_REGISTRY_RATE_LIMIT_BYTE_SNIPPETS = tuple(
+    snippet.encode("ascii") for snippet in REGISTRY_RATE_LIMIT_SNIPPETS
 )
 KEYWORD_COMMAND_PATTERNS: tuple[tuple[str, tuple[str, ...]], ...] = (
     ("bun run typecheck", ("type-check", "typecheck", "type checking", "tsc")),
@@ -225,6 +258,8 @@ _SUITE_BASELINE_LOCKS_GUARD = threading.Lock()
 _SUITE_BASELINE_LOCKS: dict[Path, threading.Lock] = {}
 _PROVIDER_PRECHECK_LOCKS_GUARD = threading.Lock()
 _PROVIDER_PRECHECK_LOCKS: dict[Path, threading.Lock] = {}
+_DOCKER_COMPOSE_VERSION_CACHE_GUARD = threading.Lock()
+_DOCKER_COMPOSE_VERSION_CACHE: dict[tuple[str, ...], tuple[int, int, int]] = {}
 
 
 class ScaffoldPreflightError(RuntimeError):
@@ -952,8 +987,11 @@ def cleanup_stale_harbor_build_processes() -> None:
         candidate_pids=candidate_pids,
         orphan_harbor_run_set=orphan_harbor_run_set,
     )
-    stale_pids = sorted(set(orphan_harbor_run_pids).union(stale_build_pids))
-    for pid in stale_pids:
+    _terminate_pids(sorted(orphan_harbor_run_set.union(stale_build_pids)))
+
+
+def _terminate_pids(pids: list[int]) -> None:
+    for pid in pids:
         try:
             os.kill(pid, signal.SIGTERM)
         except ProcessLookupError:
@@ -961,25 +999,17 @@ def cleanup_stale_harbor_build_processes() -> None:
 
 
 def _collect_harbor_process_candidates() -> tuple[dict[int, int], list[int], list[int]] | None:
-    listing = subprocess.run(
-        ["ps", "-ax", "-o", "pid=,ppid=,command="],
-        capture_output=True,
-        text=True,
-        timeout=30,
-        check=False,
-    )
-    if listing.returncode != 0:
+    processes = _list_processes()
+    if processes is None:
         return None
 
     process_table: dict[int, int] = {}
     candidate_pids: list[int] = []
     orphan_harbor_run_pids: list[int] = []
-    for line in listing.stdout.splitlines():
-        parsed = _parse_process_listing_line(line)
-        if parsed is None:
-            continue
-        pid, ppid, command = parsed
+    for pid, ppid, command in processes:
         process_table[pid] = ppid
+        if not _contains_any(command, HARBOR_PROCESS_MARKERS):
+            continue
         if _is_orphan_harbor_run_command(command=command, ppid=ppid):
             orphan_harbor_run_pids.append(pid)
         if _is_harbor_build_command(command):
@@ -988,37 +1018,72 @@ def _collect_harbor_process_candidates() -> tuple[dict[int, int], list[int], lis
     return process_table, candidate_pids, orphan_harbor_run_pids
 
 
+def _list_processes() -> list[tuple[int, int, str]] | None:
+    """Return `(pid, ppid, command)` rows, reading procfs directly when available."""
+    if PROC_ROOT.is_dir():
+        return _list_processes_from_proc(PROC_ROOT)
+    return _list_processes_from_ps()
+
+
+def _list_processes_from_ps() -> list[tuple[int, int, str]] | None:
+    listing = subprocess.run(
+        ["ps", "-ax", "-o", "pid=,ppid=,command="],
+        capture_output=True,
+        text=True,
+        timeout=30,
+        check=False,
+    )
+    if listing.returncode != 0:
+        return None
+    return [
+        (int(match[1]), int(match[2]), match[3])
+        for match in PROCESS_LISTING_LINE_PATTERN.finditer(listing.stdout)
+    ]
+
+
+def _list_processes_from_proc(proc_root: Path) -> list[tuple[int, int, str]]:
+    processes: list[tuple[int, int, str]] = []
+    with os.scandir(proc_root) as entries:
+        for entry in entries:
+            if not entry.name.isdigit():
+                continue
+            parsed = _read_proc_process(Path(entry.path))
+            if parsed is not None:
+                processes.append((int(entry.name), *parsed))
+    return processes
+
+
+def _read_proc_process(proc_dir: Path) -> tuple[int, str] | None:
+    try:
+        stat = (proc_dir / "stat").read_bytes()
+        cmdline = (proc_dir / "cmdline").read_bytes()
+    except OSError:
+        # The process exited (or is not readable) between listing and reading.
+        return None
+    # `comm` is parenthesised and may itself contain spaces or parentheses.
+    fields = stat[stat.rfind(b")") + 1 :].split()
+    if len(fields) < 2 or not fields[1].isdigit():
+        return None
+    command = cmdline.replace(b"\0", b" ").decode("utf-8", errors="replace").strip()
+    return int(fields[1]), command
+
+
 def _stale_harbor_build_pids(
     *,
     process_table: dict[int, int],
     candidate_pids: list[int],
     orphan_harbor_run_set: set[int],
 ) -> list[int]:
+    orphan_run_descendants = _descendant_pids(
+        process_table=process_table, root_pids=orphan_harbor_run_set
+    )
     return [
         pid
         for pid in candidate_pids
-        if process_table.get(pid, 0) <= 1
-        or _has_ancestor_in_set(
-            pid=pid,
-            process_table=process_table,
-            ancestor_set=orphan_harbor_run_set,
-        )
+        if process_table.get(pid, 0) <= 1 or pid in orphan_run_descendants
     ]
 
 
-def _parse_process_listing_line(line: str) -> tuple[int, int, str] | None:
-    line = line.strip()
-    if not line:
-        return None
-    parts = line.split(maxsplit=2)
-    if len(parts) != 3:
-        return None
-    pid_text, ppid_text, command = parts
-    if not pid_text.isdigit() or not ppid_text.isdigit():
-        return None
-    return int(pid_text), int(ppid_text), command
-
-
 def _is_harbor_build_command(command: str) -> bool:
     return bool(
         HARNESS_STALE_BUILD_PATTERN.search(command) or HARNESS_STALE_BUILDX_PATTERN.search(command)
@@ -1029,20 +1094,20 @@ def _is_orphan_harbor_run_command(*, command: str, ppid: int) -> bool:
     return ppid <= 1 and bool(HARNESS_STALE_RUN_PATTERN.search(command))
 
 
-def _has_ancestor_in_set(
-    *,
-    pid: int,
-    process_table: dict[int, int],
-    ancestor_set: set[int],
-) -> bool:
-    current = process_table.get(pid, 0)
-    seen: set[int] = set()
-    while current > 1 and current not in seen:
-        if current in ancestor_set:
-            return True
-        seen.add(current)
-        current = process_table.get(current, 0)
-    return current in ancestor_set
+def _descendant_pids(*, process_table: dict[int, int], root_pids: set[int]) -> set[int]:
+    if not root_pids:
+        return set()
+    children_by_ppid: dict[int, list[int]] = {}
+    for pid, ppid in process_table.items():
+        children_by_ppid.setdefault(ppid, []).append(pid)
+    descendants: set[int] = set()
+    pending = list(root_pids)
+    while pending:
+        for child in children_by_ppid.get(pending.pop(), ()):
+            if child not in descendants:
+                descendants.add(child)
+                pending.append(child)
+    return descendants
 
 
 def _build_harbor_run_env(adapter: Any) -> dict[str, str]:
@@ -1055,9 +1120,31 @@ def _build_harbor_run_env(adapter: Any) -> dict[str, str]:
 
 
 def _redact_sensitive_text(value: str) -> str:
-    redacted = INLINE_SECRET_PATTERN.sub(r"\1=[REDACTED]", value)
-    redacted = JSON_SECRET_PATTERN.sub(r'"\1":"[REDACTED]"', redacted)
-    return KEY_LIKE_TOKEN_PATTERN.sub("[REDACTED]", redacted)
+    if not _contains_snippet(value, SECRET_REDACTION_MARKERS):
+        return value
+    return SECRET_REDACTION_PATTERN.sub(_secret_redaction_replacement, value)
+
+
+def _secret_redaction_replacement(match: re.Match[str]) -> str:
+    if match.lastgroup == "inline":
+        return f"{match['inline_key']}=[REDACTED]"
+    if match.lastgroup == "json":
+        return f'"{match["json_key"]}":"[REDACTED]"'
+    return "[REDACTED]"
+
+
+def _redact_sensitive_bytes(value: bytes) -> bytes:
+    if not any(marker in value for marker in _SECRET_REDACTION_BYTE_MARKERS):
+        return value
+    return SECRET_REDACTION_BYTES_PATTERN.sub(_secret_redaction_bytes_replacement, value)
+
+
+def _secret_redaction_bytes_replacement(match: re.Match[bytes]) -> bytes:
+    if match.lastgroup == "inline":
+        return match["inline_key"] + b"=[REDACTED]"
+    if match.lastgroup == "json":
+        return b'"' + match["json_key"] + b'":"[REDACTED]"'
+    return b"[REDACTED]"
 
 
 def _inject_secret_file_env(run_env: dict[str, str]) -> None:
@@ -1074,17 +1161,20 @@ def _write_harbor_secret_file(*, secret_name: str, secret_value: str) -> Path:
     secret_dir = Path.home() / ".agentic-eval" / "secrets"
     secret_dir.mkdir(parents=True, exist_ok=True)
     secret_path = secret_dir / f"{secret_name.lower()}-{uuid.uuid4().hex}"
-    secret_path.write_text(secret_value, encoding="utf-8")
-    secret_path.chmod(0o600)
+    # Create the file owner-only up front so the secret is never briefly world-readable.
+    fd = os.open(secret_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+    try:
+        os.write(fd, secret_value.encode("utf-8"))
+    finally:
+        os.close(fd)
     return secret_path
 
 
 def _parse_docker_compose_version(raw: str) -> tuple[int, int, int] | None:
-    match = DOCKER_COMPOSE_VERSION_PATTERN.search(raw.strip())
+    match = DOCKER_COMPOSE_VERSION_PATTERN.search(raw)
     if not match:
         return None
-    major, minor, patch = match.groups()
-    return int(major), int(minor), int(patch)
+    return int(match[1]), int(match[2]), int(match[3])
 
 
 def _read_docker_compose_version(run_env: dict[str, str]) -> tuple[int, int, int] | None:
@@ -1108,12 +1198,26 @@ def _read_docker_compose_version(run_env: dict[str, str]) -> tuple[int, int, int
     return None
 
 
+def _cached_docker_compose_version(run_env: dict[str, str]) -> tuple[int, int, int] | None:
+    cache_key = tuple(run_env.get(key, "") for key in DOCKER_COMPOSE_VERSION_ENV_KEYS)
+    with _DOCKER_COMPOSE_VERSION_CACHE_GUARD:
+        cached = _DOCKER_COMPOSE_VERSION_CACHE.get(cache_key)
+    if cached is not None:
+        return cached
+    version = _read_docker_compose_version(run_env)
+    # Only successful detections are cached so a missing docker CLI is re-probed.
+    if version is not None:
+        with _DOCKER_COMPOSE_VERSION_CACHE_GUARD:
+            _DOCKER_COMPOSE_VERSION_CACHE[cache_key] = version
+    return version
+
+
 def _format_version(version: tuple[int, int, int]) -> str:
     return ".".join(str(part) for part in version)
 
 
 def _docker_compose_preflight_reason(run_env: dict[str, str]) -> str | None:
-    version = _read_docker_compose_version(run_env)
+    version = _cached_docker_compose_version(run_env)
     if version is None:
         return None
     if version < MIN_DOCKER_COMPOSE_VERSION:
@@ -1157,8 +1261,9 @@ def _is_registry_rate_limited(run_harbor_dir: Path) -> bool:
         log_path = run_harbor_dir / name
         if not log_path.exists():
             continue
-        log_text = log_path.read_text(encoding="utf-8", errors="replace")
-        if REGISTRY_RATE_LIMIT_PATTERN.search(log_text):
+        # Markers are ASCII, so lowercasing the raw bytes avoids decoding large logs.
+        log_bytes = log_path.read_bytes().lower()
+        if any(snippet in log_bytes for snippet in _REGISTRY_RATE_LIMIT_BYTE_SNIPPETS):
             return True
     return False
 
@@ -1638,6 +1743,7 @@ def prepare_run_context(request: RunRequest) -> ScaffoldContext:
 def execute_harbor(request: HarborExecutionRequest) -> HarborExecutionResult:
     """Execute Harbor against a local task bundle."""
     request.jobs_dir.mkdir(parents=True, exist_ok=True)
+    request.run_harbor_dir.mkdir(parents=True, exist_ok=True)
     job_name = f"orchestrator-{request.run_id}"
     job_dir = request.jobs_dir / job_name
     harbor_cmd = request.adapter.build_harbor_command(
@@ -1670,7 +1776,7 @@ def execute_harbor(request: HarborExecutionRequest) -> HarborExecutionResult:
                 trial_dir=None,
             )
         cleanup_stale_harbor_resources()
-        time.sleep(HARBOR_RATE_LIMIT_RETRY_DELAY_SEC)
+        time.sleep(_rate_limit_retry_delay(attempt))
 
     if execution_error:
         return _terminated_harbor_result(job_dir=job_dir, reason=execution_error, trial_dir=None)
@@ -1692,6 +1798,13 @@ def execute_harbor(request: HarborExecutionRequest) -> HarborExecutionResult:
     )
 
 
+def _rate_limit_retry_delay(attempt: int) -> float:
+    # Exponential backoff with jitter so parallel runs do not retry the registry in lockstep.
+    backoff = HARBOR_RATE_LIMIT_RETRY_DELAY_SEC * 2 ** (attempt - 1)
+    capped = min(backoff, HARBOR_RATE_LIMIT_RETRY_MAX_DELAY_SEC)
+    return capped + random.uniform(0, HARBOR_RATE_LIMIT_RETRY_JITTER_SEC)
+
+
 def _harbor_process_timeout(task_timeout_sec: int) -> int:
     """Allow Harbor build + verifier overhead beyond agent task timeout."""
     return max(task_timeout_sec + HARBOR_TIMEOUT_BUFFER_SEC, int(task_timeout_sec * 1.25))
@@ -1720,7 +1833,6 @@ def _run_harbor_process(
     run_harbor_dir: Path,
     job_dir: Path,
 ) -> str | None:
-    run_harbor_dir.mkdir(parents=True, exist_ok=True)
     command_path = run_harbor_dir / "command.txt"
     stdout_path = run_harbor_dir / "harbor-stdout.log"
     stderr_path = run_harbor_dir / "harbor-stderr.log"
@@ -1738,7 +1850,6 @@ def _run_harbor_process(
             cwd=workspace,
             stdout=subprocess.PIPE,
             stderr=subprocess.PIPE,
-            text=True,
             env=run_env,
             start_new_session=True,
         )
@@ -1753,8 +1864,10 @@ def _run_harbor_process(
         _terminate_process_group(process)
         stdout, stderr = process.communicate()
 
-    stdout_path.write_text(_redact_sensitive_text(stdout or ""))
-    stderr_path.write_text(_redact_sensitive_text(stderr or ""))
+    # Redact the raw bytes so large logs skip a decode/encode round trip and
+    # non-UTF-8 output cannot break capture.
+    stdout_path.write_bytes(_redact_sensitive_bytes(stdout or b""))
+    stderr_path.write_bytes(_redact_sensitive_bytes(stderr or b""))
 
     if timed_out:
         return _timeout_reason(timeout_sec=timeout_sec, job_dir=job_dir)
@@ -1763,7 +1876,7 @@ def _run_harbor_process(
     return None
 
 
-def _terminate_process_group(process: subprocess.Popen[str]) -> None:
+def _terminate_process_group(process: subprocess.Popen[bytes]) -> None:
     if process.poll() is not None:
         return
     try:
@@ -210,6 +210,32 @@ class OptimizationScore(BaseModel):
         return round(max(0.0, min(1.0, 1.0 - weighted_penalty)), 3)
 
 
+def weighted_quality_score(
+    *,
+    functional: float,
+    compliance: float,
+    visual: float | None,
+    efficiency: float,
+) -> float:
+    """Combine dimension scores using the configured quality weights."""
+    w = settings.weights
+    if visual is not None:
+        return (
+            functional * w.functional
+            + compliance * w.compliance
+            + visual * w.visual
+            + efficiency * w.efficiency
+        )
+
+    # Redistribute visual weight proportionally to other dimensions
+    non_visual_total = w.functional + w.compliance + w.efficiency
+    return (
+        functional * (w.functional / non_visual_total)
+        + compliance * (w.compliance / non_visual_total)
+        + efficiency * (w.efficiency / non_visual_total)
+    )
+
+
 class Scorecard(BaseModel):
     """Complete scorecard for an evaluation run."""
 
@@ -244,27 +270,11 @@ class Scorecard(BaseModel):
 
         Weights from config. If visual is None, redistributes visual weight proportionally.
         """
-        w = settings.weights
-        visual_score = self.visual.score if self.visual else 0.0
-
-        if self.visual:
-            return (
-                self.functional.score * w.functional
-                + self.compliance.score * w.compliance
-                + visual_score * w.visual
-                + self.efficiency.score * w.efficiency
-            )
-
-        # Redistribute visual weight proportionally to other dimensions
-        non_visual_total = w.functional + w.compliance + w.efficiency
-        func_adj = w.functional / non_visual_total
-        comp_adj = w.compliance / non_visual_total
-        eff_adj = w.efficiency / non_visual_total
-
-        return (
-            self.functional.score * func_adj
-            + self.compliance.score * comp_adj
-            + self.efficiency.score * eff_adj
+        return weighted_quality_score(
+            functional=self.functional.score,
+            compliance=self.compliance.score,
+            visual=self.visual.score if self.visual else None,
+            efficiency=self.efficiency.score,
         )
 
     @computed_field
@@ -1,7 +1,11 @@
 """Run storage and aggregation for evaluation results."""
 
+from __future__ import annotations
+
 import csv
 import json
+import os
+from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
 
@@ -28,9 +32,9 @@ def save_run(run: EvalRun, results_dir: Path) -> Path:
     return output_path
 
 
-def load_run(path: Path) -> EvalRun:
+def load_run(path: Path | str) -> EvalRun:
     """Load an evaluation run from JSON file."""
-    with open(path) as f:
+    with open(path, "rb") as f:
         return EvalRun.model_validate_json(f.read())
 
 
@@ -38,19 +42,26 @@ def load_all_runs(results_dir: Path) -> list[EvalRun]:
     """Load all evaluation runs from an evals directory."""
     runs = []
 
-    for json_file in results_dir.glob("**/runs/*/run.json"):
-        try:
-            runs.append(load_run(json_file))
-        except Exception:
-            continue  # Skip invalid files
+    # Equivalent to glob("**/runs/*/run.json") without building a Path per directory entry.
+    root = os.fspath(results_dir)
+    for dirpath, dirnames, _ in os.walk(root):
+        if dirpath == root or os.path.basename(dirpath) != "runs":
+            continue
+        for run_dir in dirnames:
+            try:
+                runs.append(load_run(os.path.join(dirpath, run_dir, "run.json")))
+            except Exception:
+                continue  # Skip missing or invalid files
     return sorted(runs, key=lambda r: r.timestamp)
 
 
-def _variance(values: list[float]) -> float:
-    if len(values) < 2:
-        return 0.0
+def _mean_and_variance(values: list[float]) -> tuple[float, float]:
+    if not values:
+        return 0.0, 0.0
     mean = sum(values) / len(values)
-    return sum((value - mean) ** 2 for value in values) / len(values)
+    if len(values) < 2:
+        return mean, 0.0
+    return mean, sum((value - mean) ** 2 for value in values) / len(values)
 
 
 def _uncached_tokens(run: EvalRun) -> int:
@@ -77,47 +88,75 @@ def _empty_group_stats() -> dict[str, float | int]:
     }
 
 
+@dataclass(frozen=True, slots=True)
+class _RunView:
+    """Scored fields of one run, read once and shared by every aggregate grouping."""
+
+    voided: bool
+    composite_score: float
+    diagnostic_score: float
+    duration_sec: float
+    validity_passed: bool
+    performance_passed: bool
+
+    @classmethod
+    def from_run(cls, run: EvalRun) -> _RunView:
+        scores = run.scores
+        return cls(
+            voided=scores.voided,
+            composite_score=scores.composite_score,
+            diagnostic_score=scores.diagnostic_score,
+            duration_sec=run.duration_sec,
+            validity_passed=scores.run_validity.passed,
+            performance_passed=scores.performance_gates.passed,
+        )
+
+
 def _safe_ratio(numerator: int, denominator: int) -> float:
     if denominator == 0:
         return 0.0
     return numerator / denominator
 
 
-def _safe_average(values: list[float]) -> float:
-    if not values:
-        return 0.0
-    return sum(values) / len(values)
-
-
-def _scored_runs(runs_list: list[EvalRun]) -> list[EvalRun]:
-    return [run for run in runs_list if not run.scores.voided]
-
-
-def _group_stats(runs_list: list[EvalRun]) -> dict[str, float | int]:
+def _group_stats(runs_list: list[_RunView]) -> dict[str, float | int]:
     if not runs_list:
         return _empty_group_stats()
 
-    scored_runs = _scored_runs(runs_list)
-    void_count = len(runs_list) - len(scored_runs)
-    composite_scores = [run.scores.composite_score for run in scored_runs]
-    diagnostic_scores = [run.scores.diagnostic_score for run in scored_runs]
-    durations = [run.duration_sec for run in scored_runs]
-    valid_runs = [run for run in scored_runs if run.scores.run_validity.passed]
-    performance_pass_runs = [run for run in scored_runs if run.scores.performance_gates.passed]
-    scored_count = len(scored_runs)
+    # Single pass over the group: gather the per-metric columns and pass counts together.
+    composite_scores: list[float] = []
+    diagnostic_scores: list[float] = []
+    durations: list[float] = []
+    valid_count = 0
+    performance_pass_count = 0
+    for run in runs_list:
+        if run.voided:
+            continue
+        composite_scores.append(run.composite_score)
+        diagnostic_scores.append(run.diagnostic_score)
+        durations.append(run.duration_sec)
+        if run.validity_passed:
+            valid_count += 1
+        if run.performance_passed:
+            performance_pass_count += 1
+
+    scored_count = len(composite_scores)
+    void_count = len(runs_list) - scored_count
+    avg_score, score_variance = _mean_and_variance(composite_scores)
+    avg_diagnostic, diagnostic_variance = _mean_and_variance(diagnostic_scores)
+    avg_duration, duration_variance = _mean_and_variance(durations)
     return {
         "count": len(runs_list),
         "scored_count": scored_count,
         "void_count": void_count,
         "void_rate": _safe_ratio(void_count, len(runs_list)),
-        "avg_score": _safe_average(composite_scores),
-        "score_variance": _variance(composite_scores),
-        "validity_rate": _safe_ratio(len(valid_runs), scored_count),
-        "performance_pass_rate": _safe_ratio(len(performance_pass_runs), scored_count),
-        "avg_diagnostic_score": _safe_average(diagnostic_scores),
-        "diagnostic_variance": _variance(diagnostic_scores),
-        "avg_duration_sec": _safe_average(durations),
-        "duration_variance_sec": _variance(durations),
+        "avg_score": avg_score,
+        "score_variance": score_variance,
+        "validity_rate": _safe_ratio(valid_count, scored_count),
+        "performance_pass_rate": _safe_ratio(performance_pass_count, scored_count),
+        "avg_diagnostic_score": avg_diagnostic,
+        "diagnostic_variance": diagnostic_variance,
+        "avg_duration_sec": avg_duration,
+        "duration_variance_sec": duration_variance,
     }
 
 
@@ -134,24 +173,26 @@ def aggregate_results(runs: list[EvalRun]) -> dict:
         return {"total_runs": 0}
 
     # Group by configuration
-    by_harness: dict[str, list[EvalRun]] = {}
-    by_model: dict[str, list[EvalRun]] = {}
-    by_scaffold: dict[str, list[EvalRun]] = {}
-    by_config: dict[str, list[EvalRun]] = {}
+    by_harness: dict[str, list[_RunView]] = {}
+    by_model: dict[str, list[_RunView]] = {}
+    by_scaffold: dict[str, list[_RunView]] = {}
+    by_config: dict[str, list[_RunView]] = {}
 
     for run in runs:
-        harness = run.config.harness
-        model = run.config.model
-        scaffold_key = run.config.scaffold_root
+        config = run.config
+        harness = config.harness
+        model = config.model
+        scaffold_key = config.scaffold_root
         config_key = (
-            f"{harness}|{model}|{run.config.task_name}|"
-            f"{run.config.task_version}|{run.config.scaffold_root}"
+            f"{harness}|{model}|{config.task_name}|{config.task_version}|{config.scaffold_root}"
         )
 
-        by_harness.setdefault(harness, []).append(run)
-        by_model.setdefault(model, []).append(run)
-        by_scaffold.setdefault(scaffold_key, []).append(run)
-        by_config.setdefault(config_key, []).append(run)
+        # Computed scores are read once here rather than once per grouping.
+        view = _RunView.from_run(run)
+        by_harness.setdefault(harness, []).append(view)
+        by_model.setdefault(model, []).append(view)
+        by_scaffold.setdefault(scaffold_key, []).append(view)
+        by_config.setdefault(config_key, []).append(view)
 
     return {
         "total_runs": len(runs),
@@ -11,6 +11,18 @@ import raidar.runner as runner
 from raidar.harness.config import Agent, HarnessConfig, ModelTarget
 
 
+@pytest.fixture(autouse=True)
+def _clear_docker_compose_version_cache():
+    runner._DOCKER_COMPOSE_VERSION_CACHE.clear()
+    yield
+    runner._DOCKER_COMPOSE_VERSION_CACHE.clear()
+
+
+@pytest.fixture(autouse=True)
+def _list_processes_with_ps(monkeypatch, tmp_path):
+    monkeypatch.setattr(runner, "PROC_ROOT", tmp_path / "no-procfs")
+
+
 class _AdapterStub:
     def runtime_env(self) -> dict[str, str]:
         return {"ADAPTER_FLAG": "1", "COMPOSE_BAKE": "1"}
@@ -28,9 +40,14 @@ def test_build_harbor_run_env_forces_compose_bake_off(tmp_path, monkeypatch) ->
     secret_file = runner.Path(env["AGENTIC_EVAL_SECRET_FILE_OPENAI_API_KEY"])
     assert secret_file.exists()
     assert secret_file.read_text(encoding="utf-8") == "test-openai-key"
+    assert secret_file.stat().st_mode & 0o777 == 0o600
     assert "DOCKER_CONFIG" not in env
 
 
+def test_secret_env_keys_are_all_redacted() -> None:
+    assert set(runner.SECRET_ENV_KEYS) <= set(runner.REDACTED_SECRET_KEYS)
+
+
 class _ExecAdapterStub:
     def build_harbor_command(self, *, task_path: Path, job_name: str, jobs_dir: Path) -> list[str]:
         del task_path, job_name, jobs_dir
@@ -145,10 +162,88 @@ def test_cleanup_stale_harbor_build_processes_kills_orphan_harbor_run_trees(
     ]
 
 
+def test_cleanup_stale_harbor_build_processes_skips_malformed_listing_lines(
+    monkeypatch,
+) -> None:
+    ps_output = "\n".join(
+        [
+            "  PID  PPID COMMAND",
+            "",
+            "3001 1",
+            "abc 1 docker compose -p harbor-task-x -f /tmp/docker-compose-build.yaml build",
+            "  3002   1  docker compose -p harbor-task-y -f /tmp/docker-compose-build.yaml build ",
+        ]
+    )
+
+    def fake_run(*args, **kwargs):
+        del args, kwargs
+        return subprocess.CompletedProcess(
+            ["ps", "-ax", "-o", "pid=,ppid=,command="], 0, stdout=ps_output, stderr=""
+        )
+
+    killed: list[int] = []
+
+    monkeypatch.setattr(runner.subprocess, "run", fake_run)
+    monkeypatch.setattr(runner.os, "kill", lambda pid, sig: killed.append(pid))
+
+    runner.cleanup_stale_harbor_build_processes()
+
+    assert killed == [3002]
+
+
+def _write_proc_entry(proc_root: Path, pid: int, ppid: int, argv: list[str]) -> None:
+    proc_dir = proc_root / str(pid)
+    proc_dir.mkdir(parents=True)
+    (proc_dir / "stat").write_bytes(f"{pid} (odd) name) S {ppid} {pid} {pid} 0".encode())
+    (proc_dir / "cmdline").write_bytes(b"\0".join(arg.encode() for arg in argv) + b"\0")
+
+
+def test_cleanup_stale_harbor_build_processes_reads_procfs(monkeypatch, tmp_path) -> None:
+    proc_root = tmp_path / "proc"
+    _write_proc_entry(
+        proc_root,
+        4001,
+        1,
+        ["harbor", "run", "--path", "/tmp/harbor-task-abc", "--job-name", "x"],
+    )
+    _write_proc_entry(
+        proc_root,
+        4002,
+        4001,
+        [
+            "docker",
+            "compose",
+            "-p",
+            "harbor-task-abc",
+            "-f",
+            "/tmp/docker-compose-build.yaml",
+            "build",
+        ],
+    )
+    _write_proc_entry(proc_root, 4003, 1, ["sleep", "30"])
+    (proc_root / "self").mkdir()
+    (proc_root / "4004").mkdir()
+
+    def fail_run(*args, **kwargs):
+        raise AssertionError("ps should not run when procfs is available")
+
+    killed: list[int] = []
+
+    monkeypatch.setattr(runner, "PROC_ROOT", proc_root)
+    monkeypatch.setattr(runner.subprocess, "run", fail_run)
+    monkeypatch.setattr(runner.os, "kill", lambda pid, sig: killed.append(pid))
+
+    runner.cleanup_stale_harbor_build_processes()
+
+    assert killed == [4001, 4002]
+
+
 def test_parse_docker_compose_version_variants() -> None:
     assert runner._parse_docker_compose_version("2.40.1") == (2, 40, 1)
     assert runner._parse_docker_compose_version("v2.40.1-desktop.1") == (2, 40, 1)
     assert runner._parse_docker_compose_version("Docker Compose version v2.39.2") == (2, 39, 2)
+    assert runner._parse_docker_compose_version("  2.40.1\n") == (2, 40, 1)
+    assert runner._parse_docker_compose_version("build 12345, version 2.40.1") == (2, 40, 1)
     assert runner._parse_docker_compose_version("unknown") is None
 
 
@@ -184,6 +279,39 @@ def test_docker_compose_preflight_reason_allows_supported_versions(monkeypatch)
     assert runner._docker_compose_preflight_reason({}) is None
 
 
+def test_docker_compose_preflight_reason_caches_detected_version(monkeypatch) -> None:
+    calls: list[list[str]] = []
+
+    def fake_run(*args, **kwargs):
+        del kwargs
+        calls.append(list(args[0]))
+        return subprocess.CompletedProcess(list(args[0]), 0, stdout="2.40.1\n", stderr="")
+
+    monkeypatch.setattr(runner.subprocess, "run", fake_run)
+
+    assert runner._docker_compose_preflight_reason({"PATH": "/usr/bin"}) is None
+    assert runner._docker_compose_preflight_reason({"PATH": "/usr/bin"}) is None
+    assert len(calls) == 1
+
+    assert runner._docker_compose_preflight_reason({"PATH": "/opt/docker/bin"}) is None
+    assert len(calls) == 2
+
+
+def test_docker_compose_preflight_reason_reprobes_when_docker_missing(monkeypatch) -> None:
+    calls: list[list[str]] = []
+
+    def fake_run(*args, **kwargs):
+        del kwargs
+        calls.append(list(args[0]))
+        raise FileNotFoundError("docker")
+
+    monkeypatch.setattr(runner.subprocess, "run", fake_run)
+
+    assert runner._docker_compose_preflight_reason({}) is None
+    assert runner._docker_compose_preflight_reason({}) is None
+    assert len(calls) == 2
+
+
 def test_redact_sensitive_text_masks_inline_env_and_json_values() -> None:
     original = (
         "docker compose exec -e ANTHROPIC_API_KEY=sk-ant-secret "
@@ -200,6 +328,52 @@ def test_redact_sensitive_text_masks_inline_env_and_json_values() -> None:
     assert '"GEMINI_API_KEY":"[REDACTED]"' in redacted
 
 
+def test_secret_redaction_markers_cover_every_secret_key() -> None:
+    for key in runner.REDACTED_SECRET_KEYS:
+        assert any(marker in key for marker in runner.SECRET_REDACTION_MARKERS), key
+
+
+def test_redact_sensitive_bytes_matches_text_redaction() -> None:
+    original = (
+        "docker compose exec -e ANTHROPIC_API_KEY=sk-ant-secret "
+        'payload={"GEMINI_API_KEY": "abc123"} token sk-abcdefghijklmnopqrstu'
+    )
+
+    redacted = runner._redact_sensitive_bytes(original.encode() + b"\xff\xfe")
+
+    assert redacted == runner._redact_sensitive_text(original).encode() + b"\xff\xfe"
+
+
+@pytest.mark.parametrize("key", runner.REDACTED_SECRET_KEYS)
+def test_redact_sensitive_text_covers_every_secret_key(key: str) -> None:
+    redacted = runner._redact_sensitive_text(f'{key}=top-secret {{"{key}": "top-secret"}}')
+
+    assert "top-secret" not in redacted
+    assert f"{key}=[REDACTED]" in redacted
+    assert f'"{key}":"[REDACTED]"' in redacted
+
+
+def test_redact_sensitive_text_masks_key_like_tokens_in_one_pass() -> None:
+    original = 'token sk-abcdefghijklmnopqrstu and {"OPENAI_API_KEY": "sk-abcdefghijklmnopqrstu"}'
+
+    redacted = runner._redact_sensitive_text(original)
+
+    assert redacted == 'token [REDACTED] and {"OPENAI_API_KEY":"[REDACTED]"}'
+
+
+@pytest.mark.parametrize(
+    "payload",
+    [
+        '{"OPENAI_API_KEY":"' + "a" * 200_000,
+        " sk-" + "-" * 200_000,
+        " sk-aaaaaaaaaaaaaa-" * 20_000,
+    ],
+    ids=["unterminated-json", "dash-run", "short-token-runs"],
+)
+def test_redact_sensitive_text_leaves_unterminated_payloads_intact(payload: str) -> None:
+    assert runner._redact_sensitive_text(payload) == payload
+
+
 def test_validate_public_base_images_rejects_private_registry() -> None:
     with pytest.raises(ValueError, match="private or unsupported registry host"):
         runner._validate_public_base_images("FROM registry.company.com/platform/base:1\n")
@@ -209,6 +383,17 @@ def test_validate_public_base_images_accepts_public_images() -> None:
     runner._validate_public_base_images("FROM oven/bun:1\nFROM ghcr.io/acme/tooling:latest\n")
 
 
+def test_is_registry_rate_limited_matches_markers_case_insensitively(tmp_path) -> None:
+    assert runner._is_registry_rate_limited(tmp_path) is False
+
+    (tmp_path / "harbor-stdout.log").write_text("pulling oven/bun:1\n")
+    (tmp_path / "harbor-stderr.log").write_text("Error response: TOOMANYREQUESTS: slow down\n")
+    assert runner._is_registry_rate_limited(tmp_path) is True
+
+    (tmp_path / "harbor-stderr.log").write_bytes(b"\xff\xfe Harbor exited with code 1\n")
+    assert runner._is_registry_rate_limited(tmp_path) is False
+
+
 def test_execute_harbor_retries_once_on_registry_rate_limit(monkeypatch, tmp_path) -> None:
     request = runner.HarborExecutionRequest(
         adapter=_ExecAdapterStub(),
@@ -221,8 +406,6 @@ def test_execute_harbor_retries_once_on_registry_rate_limit(monkeypatch, tmp_pat
         run_env={},
     )
     request.workspace.mkdir(parents=True, exist_ok=True)
-    request.run_harbor_dir.mkdir(parents=True, exist_ok=True)
-    request.jobs_dir.mkdir(parents=True, exist_ok=True)
 
     attempts: list[int] = []
 
@@ -241,9 +424,27 @@ def test_execute_harbor_retries_once_on_registry_rate_limit(monkeypatch, tmp_pat
 
     result = runner.execute_harbor(request)
 
+    assert request.jobs_dir.is_dir()
+    assert request.run_harbor_dir.is_dir()
     assert result.terminated_early is False
     assert len(attempts) == 2
-    assert sleeps == [runner.HARBOR_RATE_LIMIT_RETRY_DELAY_SEC]
+    assert len(sleeps) == 1
+    assert (
+        runner.HARBOR_RATE_LIMIT_RETRY_DELAY_SEC
+        <= sleeps[0]
+        <= runner.HARBOR_RATE_LIMIT_RETRY_DELAY_SEC + runner.HARBOR_RATE_LIMIT_RETRY_JITTER_SEC
+    )
+
+
+def test_rate_limit_retry_delay_backs_off_exponentially_up_to_cap(monkeypatch) -> None:
+    monkeypatch.setattr(runner.random, "uniform", lambda low, high: high)
+    jitter = runner.HARBOR_RATE_LIMIT_RETRY_JITTER_SEC
+    cap = runner.HARBOR_RATE_LIMIT_RETRY_MAX_DELAY_SEC
+
+    assert runner._rate_limit_retry_delay(1) == 20 + jitter
+    assert runner._rate_limit_retry_delay(2) == 40 + jitter
+    assert runner._rate_limit_retry_delay(3) == 80 + jitter
+    assert runner._rate_limit_retry_delay(4) == cap + jitter
 
 
 def test_execute_harbor_does_not_retry_non_rate_limit(monkeypatch, tmp_path) -> None:
@@ -258,8 +459,6 @@ def test_execute_harbor_does_not_retry_non_rate_limit(monkeypatch, tmp_path) ->
         run_env={},
     )
     request.workspace.mkdir(parents=True, exist_ok=True)
-    request.run_harbor_dir.mkdir(parents=True, exist_ok=True)
-    request.jobs_dir.mkdir(parents=True, exist_ok=True)
 
     attempts: list[int] = []
 
@@ -1,8 +1,9 @@
 """Tests for runner validity and optimization metric helpers."""
 
+import hashlib
 import json
+import re
 import threading
-import time
 from datetime import UTC, datetime
 from pathlib import Path
 
@@ -15,6 +16,7 @@ from raidar.runner import (
     ExecutionPhaseResult,
     HarborExecutionResult,
     PersistedArtifacts,
+    ProcessMetrics,
     RunLayout,
     RunRequest,
     ScaffoldContext,
@@ -24,6 +26,7 @@ from raidar.runner import (
     _load_verifier_outputs,
     _prune_workspace_artifacts,
     _resolve_homepage_screenshot_command,
+    _suite_baseline_lock,
     _workspace_changes_from_baseline,
     build_scorecard,
     collect_process_metrics,
@@ -42,7 +45,174 @@ from raidar.schemas.scorecard import (
     RequirementCoverageScore,
     RunValidityScore,
 )
-from raidar.schemas.task import DeterministicCheck, RequirementSpec, TaskDefinition
+from raidar.schemas.task import (
+    ComplianceConfig,
+    DeterministicCheck,
+    PromptConfig,
+    RequirementSpec,
+    ScaffoldConfig,
+    TaskDefinition,
+    VerificationConfig,
+    VisualConfig,
+)
+
+
+def _write_files(base: Path, files: dict[str, bytes]) -> None:
+    created: set[Path] = set()
+    for relative, content in files.items():
+        path = base / relative
+        if path.parent not in created:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            created.add(path.parent)
+        path.write_bytes(content)
+
+
+def _jsonl(entries: list[dict]) -> bytes:
+    return b"\n".join(json.dumps(entry).encode() for entry in entries)
+
+
+_SAMPLE_RUN_START = datetime(2024, 1, 1, tzinfo=UTC)
+
+_EMPTY_WORKSPACE_FINGERPRINT = f"sha256:{hashlib.sha256(b'').hexdigest()}"
+_STUB_SCAFFOLD_FINGERPRINT = "sha256:test-scaffold"
+
+_WORKSPACE_SCAFFOLD_FILES = {
+    "package.json": b"{}",
+    "bun.lock": b"",
+    "src/index.tsx": b"export const App = () => null;\n",
+}
+
+_BASE_TASK = TaskDefinition.model_construct(
+    name="homepage-implementation",
+    version="v001",
+    description="test task",
+    difficulty="medium",
+    category="greenfield-ui",
+    timeout_sec=1800,
+    scaffold=ScaffoldConfig.model_construct(root="scaffold"),
+    verification=VerificationConfig.model_construct(gates=[], required_commands=[]),
+    compliance=ComplianceConfig.model_construct(),
+    prompt=PromptConfig.model_construct(entry="prompt/task.md"),
+)
+
+_VISUAL_CONFIG = VisualConfig.model_construct(
+    reference_image="references/hero.png",
+    screenshot_command=["bun", "run", "capture-screenshot"],
+    threshold=0.95,
+)
+
+_PACKAGE_JSON_WITH_SCREENSHOT_SCRIPT = (
+    b'{"scripts": {"capture-screenshot": "bun run scripts/capture-screenshot.ts"}}'
+)
+
+_SCORE_SCRIPT_SNIPPETS = (
+    r"const testPattern = /\.(test|spec)\.tsx?$/",
+    r"/(\d+)\s+passed/gi",
+    r"/(\d+)\s+failed/gi",
+    r"/([0-9]+(?:\.[0-9]+)?)\s*%/",
+    'new RegExp(pattern, "mi").test(content)',
+)
+_SCORE_SCRIPT_PATTERN = re.compile("|".join(map(re.escape, _SCORE_SCRIPT_SNIPPETS)))
+
+
+def _claude_bash_log(*, usage: dict[str, int], typecheck: str, lint: str) -> bytes:
+    return _jsonl(
+        [
+            {
+                "type": "assistant",
+                "message": {
+                    "id": "msg_1",
+                    "usage": usage,
+                    "content": [
+                        {
+                            "type": "tool_use",
+                            "id": "toolu_typecheck",
+                            "name": "Bash",
+                            "input": {"command": typecheck},
+                        },
+                        {
+                            "type": "tool_use",
+                            "id": "toolu_lint",
+                            "name": "Bash",
+                            "input": {"command": lint},
+                        },
+                    ],
+                },
+            },
+            {
+                "type": "user",
+                "message": {
+                    "content": [
+                        {
+                            "type": "tool_result",
+                            "tool_use_id": "toolu_typecheck",
+                            "is_error": False,
+                        },
+                        {
+                            "type": "tool_result",
+                            "tool_use_id": "toolu_lint",
+                            "is_error": False,
+                        },
+                    ]
+                },
+            },
+        ]
+    )
+
+
+_CLAUDE_LOG_STRUCTURED_BASH = _claude_bash_log(
+    usage={"input_tokens": 70, "cache_read_input_tokens": 20, "output_tokens": 9},
+    typecheck="bunx tsc --noEmit",
+    lint="npm run lint",
+)
+
+_CLAUDE_LOG_TOP_LEVEL_BASH = _claude_bash_log(
+    usage={"input_tokens": 50, "cache_read_input_tokens": 0, "output_tokens": 7},
+    typecheck="bun run typecheck",
+    lint="bun run lint",
+)
+
+_CLAUDE_LOG_RESULT_USAGE = _jsonl(
+    [
+        {
+            "type": "result",
+            "usage": {
+                "input_tokens": 900,
+                "cache_read_input_tokens": 300,
+                "output_tokens": 111,
+            },
+        },
+        {
+            "type": "assistant",
+            "message": {
+                "id": "msg_1",
+                "usage": {
+                    "input_tokens": 9,
+                    "cache_read_input_tokens": 3,
+                    "output_tokens": 1,
+                },
+                "content": [],
+            },
+        },
+    ]
+)
+
+_GEMINI_TRAJECTORY_SHELL_COMMANDS = json.dumps(
+    {
+        "messages": [
+            {
+                "tokens": {"input": 30, "cached": 10, "output": 4},
+                "toolCalls": [
+                    {
+                        "name": "run_shell_command",
+                        "status": "success",
+                        "args": {"command": "bun run typecheck && bun run lint"},
+                    }
+                ],
+            }
+        ]
+    }
+).encode()
 
 
 def _sample_task() -> TaskDefinition:
@@ -90,6 +260,10 @@ def _sample_harness_config() -> HarnessConfig:
     )
 
 
+def _empty_process_metrics() -> ProcessMetrics:
+    return collect_process_metrics(_sample_task(), None, harness="codex-cli")
+
+
 def _sample_evaluation_outputs() -> EvaluationOutputs:
     return EvaluationOutputs(
         functional=FunctionalScore(
@@ -133,18 +307,21 @@ def _sample_scorecard_context(
     task_dir = tmp_path / "task"
     workspace_dir = tmp_path / "workspace"
     results_dir = tmp_path / "results"
-    task_dir.mkdir(parents=True, exist_ok=True)
     workspace_dir.mkdir(parents=True, exist_ok=True)
     results_dir.mkdir(parents=True, exist_ok=True)
-    (task_dir / "task.yaml").write_text("name: sample-task\nversion: v001\n")
-    (task_dir / "prompt").mkdir(parents=True, exist_ok=True)
-    (task_dir / "prompt" / "task.md").write_text("Build homepage\n")
+    _write_files(
+        task_dir,
+        {
+            "task.yaml": b"name: sample-task\nversion: v001\n",
+            "prompt/task.md": b"Build homepage\n",
+        },
+    )
 
     scaffold_source = ScaffoldSource(
         task_name="homepage-implementation",
         task_version="v001",
         path=workspace_dir,
-        fingerprint=directory_fingerprint(workspace_dir),
+        fingerprint=_EMPTY_WORKSPACE_FINGERPRINT,
     )
 
     request = RunRequest(
@@ -162,7 +339,7 @@ def _sample_scorecard_context(
     )
     layout = RunLayout(
         run_id="run-1234",
-        start_time=datetime.now(UTC),
+        start_time=_SAMPLE_RUN_START,
         run_label="run-01",
         root_dir=results_dir / "runs" / "run-1234",
         workspace_dir=results_dir / "runs" / "run-1234" / "workspace",
@@ -181,7 +358,7 @@ def _sample_scorecard_context(
         ),
         terminated_early=terminated_early,
         termination_reason=termination_reason,
-        process_metrics=collect_process_metrics(_sample_task(), None, harness="codex-cli"),
+        process_metrics=_empty_process_metrics(),
         events=[],
         outputs=_sample_evaluation_outputs(),
         duration_sec=12.5,
@@ -222,7 +399,13 @@ def test_ensure_suite_baseline_workspace_initializes_once_in_parallel(
     suite_baseline_dir = tmp_path / "evals" / "suite-01" / "workspace" / "baseline"
     call_count = 0
     call_lock = threading.Lock()
-    start_barrier = threading.Barrier(3)
+    prepare_entered = threading.Event()
+    release_prepare = threading.Event()
+    lock_requests = threading.Semaphore(0)
+
+    def counting_suite_baseline_lock(path: Path) -> threading.Lock:
+        lock_requests.release()
+        return _suite_baseline_lock(path)
 
     def fake_prepare_workspace(
         scaffold_dir: Path, target_dir: Path, task_dir: Path, agent: str
@@ -231,17 +414,18 @@ def test_ensure_suite_baseline_workspace_initializes_once_in_parallel(
         nonlocal call_count
         with call_lock:
             call_count += 1
-        time.sleep(0.05)
+        prepare_entered.set()
+        release_prepare.wait(timeout=5.0)
         target_dir.mkdir(parents=True, exist_ok=True)
         return target_dir, None
 
+    monkeypatch.setattr("raidar.runner._suite_baseline_lock", counting_suite_baseline_lock)
     monkeypatch.setattr("raidar.runner.prepare_workspace", fake_prepare_workspace)
 
     failures: list[Exception] = []
 
     def _run() -> None:
         try:
-            start_barrier.wait(timeout=1.0)
             _ensure_suite_baseline_workspace(
                 scaffold_dir=scaffold_dir,
                 suite_baseline_dir=suite_baseline_dir,
@@ -254,9 +438,14 @@ def test_ensure_suite_baseline_workspace_initializes_once_in_parallel(
     threads = [threading.Thread(target=_run), threading.Thread(target=_run)]
     for thread in threads:
         thread.start()
-    start_barrier.wait(timeout=1.0)
+    # Hold the first initializer inside prepare_workspace until both threads have
+    # requested the baseline lock, so the second one must contend for it.
+    assert prepare_entered.wait(timeout=5.0)
+    for _ in threads:
+        assert lock_requests.acquire(timeout=5.0)
+    release_prepare.set()
     for thread in threads:
-        thread.join()
+        thread.join(timeout=5.0)
 
     assert not failures
     assert call_count == 1
@@ -295,7 +484,7 @@ def test_collect_process_metrics_extracts_usage_and_failures(tmp_path: Path):
             },
         },
     ]
-    codex_log.write_text("\n".join(json.dumps(entry) for entry in entries))
+    codex_log.write_bytes(_jsonl(entries))
 
     metrics = collect_process_metrics(_sample_task(), trial_dir, harness="codex-cli")
 
@@ -348,7 +537,7 @@ def test_collect_process_metrics_distinguishes_test_and_coverage(tmp_path: Path)
             },
         },
     ]
-    codex_log.write_text("\n".join(json.dumps(entry) for entry in entries))
+    codex_log.write_bytes(_jsonl(entries))
 
     task = TaskDefinition.model_validate(
         {
@@ -387,263 +576,102 @@ def test_collect_process_metrics_distinguishes_test_and_coverage(tmp_path: Path)
     assert metrics.executed_required_verification_commands == 2
 
 
-def test_collect_process_metrics_extracts_gemini_commands_from_agent_stdout(tmp_path: Path):
-    trial_dir = tmp_path / "trial"
-    agent_dir = trial_dir / "agent"
-    agent_dir.mkdir(parents=True, exist_ok=True)
-    (agent_dir / "gemini-cli.trajectory.json").write_text(
-        json.dumps({"messages": [{"tokens": {"input": 20, "cached": 5, "output": 3}}]})
-    )
-    command_dir = trial_dir / "agent" / "command-0"
-    command_dir.mkdir(parents=True, exist_ok=True)
-    (command_dir / "stdout.txt").write_text(
-        "\n".join(
-            [
-                "I will run the type-checking command to ensure there are no TypeScript errors.",
-                "I have completed the smoke-task implementation. I updated `src/app/page.tsx` "
-                "with the text `Harbor smoke test ready`, and verified by running the project's "
-                "type-checking, linting, and build commands, all of which passed.",
-            ]
-        )
-    )
-
-    metrics = collect_process_metrics(_sample_task(), trial_dir, harness="gemini")
-
-    assert metrics.command_count == 3
-    assert metrics.failed_command_count == 0
-    assert metrics.required_verification_commands == 3
-    assert metrics.executed_required_verification_commands == 3
-    assert metrics.required_verification_first_pass["bun run typecheck"] == "pass"
-    assert metrics.required_verification_first_pass["bun run lint"] == "pass"
-    assert metrics.required_verification_first_pass["bun run build"] == "pass"
-
-
-def test_collect_process_metrics_extracts_gemini_trajectory_shell_commands(tmp_path: Path):
-    trial_dir = tmp_path / "trial"
-    agent_dir = trial_dir / "agent"
-    agent_dir.mkdir(parents=True, exist_ok=True)
-    (agent_dir / "gemini-cli.trajectory.json").write_text(
-        json.dumps(
+@pytest.mark.parametrize(
+    ("logs", "command_count", "first_pass"),
+    [
+        pytest.param(
             {
-                "messages": [
-                    {
-                        "tokens": {"input": 30, "cached": 10, "output": 4},
-                        "toolCalls": [
-                            {
-                                "name": "run_shell_command",
-                                "status": "success",
-                                "args": {"command": "bun run typecheck && bun run lint"},
-                            }
-                        ],
-                    }
-                ]
-            }
-        )
-    )
-
-    metrics = collect_process_metrics(_sample_task(), trial_dir, harness="gemini")
-
-    assert metrics.command_count == 2
-    assert metrics.required_verification_commands == 3
-    assert metrics.executed_required_verification_commands == 2
-    assert metrics.required_verification_first_pass["bun run typecheck"] == "pass"
-    assert metrics.required_verification_first_pass["bun run lint"] == "pass"
-    assert metrics.required_verification_first_pass["bun run build"] == "missing"
-
-
-def test_collect_process_metrics_extracts_verify_with_phrasing(tmp_path: Path):
-    trial_dir = tmp_path / "trial"
-    agent_dir = trial_dir / "agent"
-    agent_dir.mkdir(parents=True, exist_ok=True)
-    (agent_dir / "gemini-cli.trajectory.json").write_text(
-        json.dumps({"messages": [{"tokens": {"input": 10, "cached": 2, "output": 1}}]})
-    )
-    command_dir = trial_dir / "agent" / "command-0"
-    command_dir.mkdir(parents=True, exist_ok=True)
-    (command_dir / "stdout.txt").write_text(
-        "I have updated `src/app/page.tsx` with the requested text and verified "
-        "the implementation with a successful build and typecheck."
-    )
-
-    metrics = collect_process_metrics(_sample_task(), trial_dir, harness="gemini")
-
-    assert metrics.command_count == 2
-    assert metrics.required_verification_commands == 3
-    assert metrics.executed_required_verification_commands == 2
-    assert metrics.required_verification_first_pass["bun run typecheck"] == "pass"
-    assert metrics.required_verification_first_pass["bun run lint"] == "missing"
-    assert metrics.required_verification_first_pass["bun run build"] == "pass"
-
-
-def test_collect_process_metrics_extracts_claude_structured_bash_commands(tmp_path: Path):
-    trial_dir = tmp_path / "trial"
-    command_dir = trial_dir / "agent" / "command-1"
-    command_dir.mkdir(parents=True, exist_ok=True)
-    (command_dir / "stdout.txt").write_text(
-        "\n".join(
-            [
-                json.dumps(
-                    {
-                        "type": "assistant",
-                        "message": {
-                            "id": "msg_1",
-                            "usage": {
-                                "input_tokens": 70,
-                                "cache_read_input_tokens": 20,
-                                "output_tokens": 9,
-                            },
-                            "content": [
-                                {
-                                    "type": "tool_use",
-                                    "id": "toolu_typecheck",
-                                    "name": "Bash",
-                                    "input": {"command": "bunx tsc --noEmit"},
-                                },
-                                {
-                                    "type": "tool_use",
-                                    "id": "toolu_lint",
-                                    "name": "Bash",
-                                    "input": {"command": "npm run lint"},
-                                },
-                            ],
-                        },
-                    }
+                "agent/gemini-cli.trajectory.json": json.dumps(
+                    {"messages": [{"tokens": {"input": 20, "cached": 5, "output": 3}}]}
+                ).encode(),
+                "agent/command-0/stdout.txt": b"\n".join(
+                    [
+                        b"I will run the type-checking command to ensure there are no "
+                        b"TypeScript errors.",
+                        b"I have completed the smoke-task implementation. I updated "
+                        b"`src/app/page.tsx` with the text `Harbor smoke test ready`, and "
+                        b"verified by running the project's type-checking, linting, and build "
+                        b"commands, all of which passed.",
+                    ]
                 ),
-                json.dumps(
-                    {
-                        "type": "user",
-                        "message": {
-                            "content": [
-                                {
-                                    "type": "tool_result",
-                                    "tool_use_id": "toolu_typecheck",
-                                    "is_error": False,
-                                },
-                                {
-                                    "type": "tool_result",
-                                    "tool_use_id": "toolu_lint",
-                                    "is_error": False,
-                                },
-                            ]
-                        },
-                    }
+            },
+            3,
+            {"bun run typecheck": "pass", "bun run lint": "pass", "bun run build": "pass"},
+            id="agent-stdout",
+        ),
+        pytest.param(
+            {"agent/gemini-cli.trajectory.json": _GEMINI_TRAJECTORY_SHELL_COMMANDS},
+            2,
+            {"bun run typecheck": "pass", "bun run lint": "pass", "bun run build": "missing"},
+            id="trajectory-shell-commands",
+        ),
+        pytest.param(
+            {
+                "agent/gemini-cli.trajectory.json": json.dumps(
+                    {"messages": [{"tokens": {"input": 10, "cached": 2, "output": 1}}]}
+                ).encode(),
+                "agent/command-0/stdout.txt": (
+                    b"I have updated `src/app/page.tsx` with the requested text and verified "
+                    b"the implementation with a successful build and typecheck."
                 ),
-            ]
-        )
-    )
+            },
+            2,
+            {"bun run typecheck": "pass", "bun run lint": "missing", "bun run build": "pass"},
+            id="verify-with-phrasing",
+        ),
+    ],
+)
+def test_collect_process_metrics_extracts_gemini_commands(
+    tmp_path: Path,
+    logs: dict[str, bytes],
+    command_count: int,
+    first_pass: dict[str, str],
+):
+    trial_dir = tmp_path / "trial"
+    _write_files(trial_dir, logs)
 
-    metrics = collect_process_metrics(_sample_task(), trial_dir, harness="claude-code")
+    metrics = collect_process_metrics(_sample_task(), trial_dir, harness="gemini")
 
-    assert metrics.command_count == 2
+    assert metrics.command_count == command_count
     assert metrics.failed_command_count == 0
     assert metrics.required_verification_commands == 3
-    assert metrics.executed_required_verification_commands == 2
-    assert metrics.required_verification_first_pass["bun run typecheck"] == "pass"
-    assert metrics.required_verification_first_pass["bun run lint"] == "pass"
-    assert metrics.required_verification_first_pass["bun run build"] == "missing"
+    assert metrics.executed_required_verification_commands == command_count
+    assert metrics.required_verification_first_pass == first_pass
 
 
-def test_collect_process_metrics_extracts_claude_bash_from_top_level_log(tmp_path: Path):
+@pytest.mark.parametrize(
+    ("log_path", "payload"),
+    [
+        pytest.param(
+            "agent/command-1/stdout.txt", _CLAUDE_LOG_STRUCTURED_BASH, id="command-stdout"
+        ),
+        pytest.param("agent/claude-code.txt", _CLAUDE_LOG_TOP_LEVEL_BASH, id="top-level-log"),
+    ],
+)
+def test_collect_process_metrics_extracts_claude_bash_commands(
+    tmp_path: Path, log_path: str, payload: bytes
+):
     trial_dir = tmp_path / "trial"
-    agent_dir = trial_dir / "agent"
-    agent_dir.mkdir(parents=True, exist_ok=True)
-    (agent_dir / "claude-code.txt").write_text(
-        "\n".join(
-            [
-                json.dumps(
-                    {
-                        "type": "assistant",
-                        "message": {
-                            "id": "msg_1",
-                            "usage": {
-                                "input_tokens": 50,
-                                "cache_read_input_tokens": 0,
-                                "output_tokens": 7,
-                            },
-                            "content": [
-                                {
-                                    "type": "tool_use",
-                                    "id": "toolu_typecheck",
-                                    "name": "Bash",
-                                    "input": {"command": "bun run typecheck"},
-                                },
-                                {
-                                    "type": "tool_use",
-                                    "id": "toolu_lint",
-                                    "name": "Bash",
-                                    "input": {"command": "bun run lint"},
-                                },
-                            ],
-                        },
-                    }
-                ),
-                json.dumps(
-                    {
-                        "type": "user",
-                        "message": {
-                            "content": [
-                                {
-                                    "type": "tool_result",
-                                    "tool_use_id": "toolu_typecheck",
-                                    "is_error": False,
-                                },
-                                {
-                                    "type": "tool_result",
-                                    "tool_use_id": "toolu_lint",
-                                    "is_error": False,
-                                },
-                            ]
-                        },
-                    }
-                ),
-            ]
-        )
-    )
+    _write_files(trial_dir, {log_path: payload})
 
     metrics = collect_process_metrics(_sample_task(), trial_dir, harness="claude-code")
 
     assert metrics.command_count == 2
+    assert metrics.failed_command_count == 0
     assert metrics.required_verification_commands == 3
     assert metrics.executed_required_verification_commands == 2
-    assert metrics.required_verification_first_pass["bun run typecheck"] == "pass"
-    assert metrics.required_verification_first_pass["bun run lint"] == "pass"
-    assert metrics.required_verification_first_pass["bun run build"] == "missing"
+    assert metrics.required_verification_first_pass == {
+        "bun run typecheck": "pass",
+        "bun run lint": "pass",
+        "bun run build": "missing",
+    }
 
 
 def test_collect_process_metrics_extracts_claude_result_usage(tmp_path: Path):
     trial_dir = tmp_path / "trial"
     agent_dir = trial_dir / "agent"
     agent_dir.mkdir(parents=True, exist_ok=True)
-    (agent_dir / "claude-code.txt").write_text(
-        "\n".join(
-            [
-                json.dumps(
-                    {
-                        "type": "result",
-                        "usage": {
-                            "input_tokens": 900,
-                            "cache_read_input_tokens": 300,
-                            "output_tokens": 111,
-                        },
-                    }
-                ),
-                json.dumps(
-                    {
-                        "type": "assistant",
-                        "message": {
-                            "id": "msg_1",
-                            "usage": {
-                                "input_tokens": 9,
-                                "cache_read_input_tokens": 3,
-                                "output_tokens": 1,
-                            },
-                            "content": [],
-                        },
-                    }
-                ),
-            ]
-        )
-    )
+    (agent_dir / "claude-code.txt").write_bytes(_CLAUDE_LOG_RESULT_USAGE)
 
     metrics = collect_process_metrics(_sample_task(), trial_dir, harness="claude-code")
 
@@ -891,38 +919,38 @@ def test_load_verifier_outputs_missing_scorecard(tmp_path: Path):
     assert reason is not None
 
 
-def test_classify_void_reasons_rate_limit():
-    reasons = _classify_void_reasons(
-        terminated_early=True,
-        termination_reason="Codex turn failed: Rate limit reached for gpt-5.2-codex.",
-    )
-    assert "provider_rate_limit" in reasons
-
-
-def test_classify_void_reasons_timeout():
-    reasons = _classify_void_reasons(
-        terminated_early=True,
-        termination_reason="Timeout expired after 420s before trial result.json was written.",
-    )
-    assert reasons == ["harbor_timeout"]
-
-
-def test_classify_void_reasons_compose_version_unsupported():
-    reasons = _classify_void_reasons(
-        terminated_early=True,
-        termination_reason=(
-            "Unsupported docker compose version 2.39.2. Require >= 2.40.1 for Harbor runs."
+@pytest.mark.parametrize(
+    ("terminated_early", "termination_reason", "expected"),
+    [
+        pytest.param(
+            True,
+            "Codex turn failed: Rate limit reached for gpt-5.2-codex.",
+            ["provider_rate_limit"],
+            id="rate-limit",
         ),
-    )
-    assert reasons == ["compose_version_unsupported"]
-
-
-def test_classify_void_reasons_empty_when_not_terminated():
+        pytest.param(
+            True,
+            "Timeout expired after 420s before trial result.json was written.",
+            ["harbor_timeout"],
+            id="timeout",
+        ),
+        pytest.param(
+            True,
+            "Unsupported docker compose version 2.39.2. Require >= 2.40.1 for Harbor runs.",
+            ["compose_version_unsupported"],
+            id="compose-version-unsupported",
+        ),
+        pytest.param(False, None, [], id="not-terminated"),
+    ],
+)
+def test_classify_void_reasons(
+    terminated_early: bool, termination_reason: str | None, expected: list[str]
+):
     reasons = _classify_void_reasons(
-        terminated_early=False,
-        termination_reason=None,
+        terminated_early=terminated_early,
+        termination_reason=termination_reason,
     )
-    assert reasons == []
+    assert reasons == expected
 
 
 def test_build_scorecard_marks_rate_limited_run_void(tmp_path: Path):
@@ -944,41 +972,17 @@ def test_create_harbor_task_bundle_copies_relative_visual_reference(tmp_path: Pa
     workspace = tmp_path / "workspace"
     task_dir = tmp_path / "task"
     results_dir = tmp_path / "results"
-    workspace.mkdir(parents=True, exist_ok=True)
     task_dir.mkdir(parents=True, exist_ok=True)
     results_dir.mkdir(parents=True, exist_ok=True)
 
-    (workspace / "package.json").write_text("{}")
-    (workspace / "bun.lock").write_text("")
-    (workspace / "src").mkdir(parents=True, exist_ok=True)
-    (workspace / "src" / "index.tsx").write_text("export const App = () => null;\n")
+    _write_files(workspace, _WORKSPACE_SCAFFOLD_FILES)
 
-    reference_rel = Path("references/hero.png")
+    reference_rel = Path(_VISUAL_CONFIG.reference_image)
     source_reference = task_dir / reference_rel
     source_reference.parent.mkdir(parents=True, exist_ok=True)
     source_reference.write_bytes(b"png-binary")
 
-    task = TaskDefinition.model_validate(
-        {
-            "name": "homepage-implementation",
-            "version": "v001",
-            "description": "test task",
-            "difficulty": "medium",
-            "category": "greenfield-ui",
-            "timeout_sec": 1800,
-            "scaffold": {
-                "root": "scaffold",
-            },
-            "verification": {"gates": [], "required_commands": []},
-            "visual": {
-                "reference_image": str(reference_rel),
-                "screenshot_command": ["bun", "run", "capture-screenshot"],
-                "threshold": 0.95,
-            },
-            "compliance": {},
-            "prompt": {"entry": "prompt/task.md"},
-        }
-    )
+    task = _BASE_TASK.model_copy(update={"visual": _VISUAL_CONFIG})
     (task_dir / "prompt").mkdir(parents=True, exist_ok=True)
     (task_dir / "prompt" / "task.md").write_text("Build homepage\n")
     request = RunRequest(
@@ -992,7 +996,7 @@ def test_create_harbor_task_bundle_copies_relative_visual_reference(tmp_path: Pa
         task_name="homepage-implementation",
         task_version="v001",
         path=workspace,
-        fingerprint=directory_fingerprint(workspace),
+        fingerprint=_STUB_SCAFFOLD_FINGERPRINT,
     )
     context = ScaffoldContext(
         scaffold_source=scaffold_source,
@@ -1016,11 +1020,8 @@ def test_create_harbor_task_bundle_copies_relative_visual_reference(tmp_path: Pa
         .startswith("#!/usr/bin/env bun")
     )
     score_script = (bundle / "tests" / "score-task.mjs").read_text(encoding="utf-8")
-    assert r"const testPattern = /\.(test|spec)\.tsx?$/" in score_script
-    assert r"/(\d+)\s+passed/gi" in score_script
-    assert r"/(\d+)\s+failed/gi" in score_script
-    assert r"/([0-9]+(?:\.[0-9]+)?)\s*%/" in score_script
-    assert 'new RegExp(pattern, "mi").test(content)' in score_script
+    found = {match.group(0) for match in _SCORE_SCRIPT_PATTERN.finditer(score_script)}
+    assert set(_SCORE_SCRIPT_SNIPPETS) - found == set()
 
 
 def test_create_harbor_task_bundle_fast_mode_sets_image_and_cli_install(
@@ -1032,34 +1033,19 @@ def test_create_harbor_task_bundle_fast_mode_sets_image_and_cli_install(
     workspace = tmp_path / "workspace"
     task_dir = tmp_path / "task"
     results_dir = tmp_path / "results"
-    workspace.mkdir(parents=True, exist_ok=True)
     task_dir.mkdir(parents=True, exist_ok=True)
     results_dir.mkdir(parents=True, exist_ok=True)
 
-    (workspace / "package.json").write_text("{}")
-    (workspace / "bun.lock").write_text("")
-    (workspace / "src").mkdir(parents=True, exist_ok=True)
-    (workspace / "src" / "index.tsx").write_text("export const App = () => null;\n")
-    (task_dir / "task.yaml").write_text("name: hello-world-smoke\nversion: v001\n")
-    (task_dir / "prompt").mkdir(parents=True, exist_ok=True)
-    (task_dir / "prompt" / "task.md").write_text("Print hello world\n")
-
-    task = TaskDefinition.model_validate(
+    _write_files(workspace, _WORKSPACE_SCAFFOLD_FILES)
+    _write_files(
+        task_dir,
         {
-            "name": "hello-world-smoke",
-            "version": "v001",
-            "description": "test task",
-            "difficulty": "easy",
-            "category": "greenfield-ui",
-            "timeout_sec": 1800,
-            "scaffold": {
-                "root": "scaffold",
-            },
-            "verification": {"gates": [], "required_commands": []},
-            "compliance": {},
-            "prompt": {"entry": "prompt/task.md"},
-        }
+            "task.yaml": b"name: hello-world-smoke\nversion: v001\n",
+            "prompt/task.md": b"Print hello world\n",
+        },
     )
+
+    task = _BASE_TASK.model_copy(update={"name": "hello-world-smoke", "difficulty": "easy"})
     request = RunRequest(
         task=task,
         config=_sample_harness_config(),
@@ -1071,7 +1057,7 @@ def test_create_harbor_task_bundle_fast_mode_sets_image_and_cli_install(
         task_name="hello-world-smoke",
         task_version="v001",
         path=workspace,
-        fingerprint=directory_fingerprint(workspace),
+        fingerprint=_STUB_SCAFFOLD_FINGERPRINT,
     )
     context = ScaffoldContext(
         scaffold_source=scaffold_source,
@@ -1099,25 +1085,7 @@ def test_resolve_homepage_screenshot_command_uses_visual_override(tmp_path: Path
     workspace.mkdir(parents=True, exist_ok=True)
     (workspace / "package.json").write_text("{}\n")
 
-    task = TaskDefinition.model_validate(
-        {
-            "name": "homepage-implementation",
-            "version": "v001",
-            "description": "task",
-            "difficulty": "medium",
-            "category": "greenfield-ui",
-            "timeout_sec": 1800,
-            "scaffold": {"root": "scaffold"},
-            "verification": {"gates": [], "required_commands": []},
-            "visual": {
-                "reference_image": "reference/homepage.png",
-                "screenshot_command": ["bun", "run", "capture-screenshot"],
-                "threshold": 0.95,
-            },
-            "compliance": {},
-            "prompt": {"entry": "prompt/task.md"},
-        }
-    )
+    task = _BASE_TASK.model_copy(update={"visual": _VISUAL_CONFIG})
 
     command = _resolve_homepage_screenshot_command(task, workspace)
     assert command == ["bun", "run", "capture-screenshot"]
@@ -1127,23 +1095,14 @@ def test_resolve_homepage_screenshot_command_uses_package_script_when_visual_mis
     tmp_path: Path,
 ):
     workspace = tmp_path / "workspace"
-    workspace.mkdir(parents=True, exist_ok=True)
-    (workspace / "package.json").write_text(
-        json.dumps({"scripts": {"capture-screenshot": "bun run scripts/capture-screenshot.ts"}})
-    )
+    _write_files(workspace, {"package.json": _PACKAGE_JSON_WITH_SCREENSHOT_SCRIPT})
 
-    task = TaskDefinition.model_validate(
-        {
+    task = _BASE_TASK.model_copy(
+        update={
             "name": "hello-world-smoke",
-            "version": "v001",
-            "description": "task",
             "difficulty": "easy",
             "category": "harness-integration",
             "timeout_sec": 300,
-            "scaffold": {"root": "scaffold"},
-            "verification": {"gates": [], "required_commands": []},
-            "compliance": {},
-            "prompt": {"entry": "prompt/task.md"},
         }
     )
 
@@ -1153,36 +1112,43 @@ def test_resolve_homepage_screenshot_command_uses_package_script_when_visual_mis
 
 def test_prune_workspace_artifacts_removes_transient_directories(tmp_path: Path):
     workspace = tmp_path / "workspace"
-    (workspace / "node_modules" / "pkg").mkdir(parents=True, exist_ok=True)
-    (workspace / "node_modules" / "pkg" / "index.js").write_text("console.log('x')\n")
-    (workspace / ".next").mkdir(parents=True, exist_ok=True)
-    (workspace / ".next" / "trace").write_text("trace\n")
-    (workspace / "src").mkdir(parents=True, exist_ok=True)
-    (workspace / "src" / "app.tsx").write_text("export const App = () => null;\n")
+    transient_files = {
+        f"node_modules/pkg-{index}/index.js": b"console.log('x')\n" for index in range(200)
+    }
+    transient_files[".next/trace"] = b"trace\n"
+    _write_files(
+        workspace,
+        {**transient_files, "src/app.tsx": b"export const App = () => null;\n"},
+    )
 
     prune = _prune_workspace_artifacts(workspace)
 
     assert "node_modules" in prune["removed"]
     assert ".next" in prune["removed"]
-    assert prune["reclaimed_bytes"] > 0
+    assert prune["reclaimed_bytes"] == sum(len(content) for content in transient_files.values())
     assert not (workspace / "node_modules").exists()
     assert not (workspace / ".next").exists()
     assert (workspace / "src" / "app.tsx").exists()
 
 
+def test_empty_workspace_fingerprint_matches_directory_fingerprint(tmp_path: Path):
+    assert directory_fingerprint(tmp_path) == _EMPTY_WORKSPACE_FINGERPRINT
+
+
 def test_workspace_changes_from_baseline_reports_added_modified_removed(tmp_path: Path):
     baseline = tmp_path / "baseline"
     run_workspace = tmp_path / "run"
     run_root = tmp_path / "run-root"
-    (baseline / "src").mkdir(parents=True, exist_ok=True)
-    (run_workspace / "src").mkdir(parents=True, exist_ok=True)
     run_root.mkdir(parents=True, exist_ok=True)
 
-    (baseline / "src" / "a.ts").write_text("export const a = 1;\n")
-    (baseline / "src" / "b.ts").write_text("export const b = 1;\n")
-
-    (run_workspace / "src" / "a.ts").write_text("export const a = 2;\n")
-    (run_workspace / "src" / "c.ts").write_text("export const c = 1;\n")
+    _write_files(
+        baseline,
+        {"src/a.ts": b"export const a = 1;\n", "src/b.ts": b"export const b = 1;\n"},
+    )
+    _write_files(
+        run_workspace,
+        {"src/a.ts": b"export const a = 2;\n", "src/c.ts": b"export const c = 1;\n"},
+    )
 
     changes = _workspace_changes_from_baseline(
         baseline_workspace=baseline,
@@ -1,5 +1,9 @@
 """Tests for scorecard computed fields."""
 
+from typing import Any
+
+import pytest
+
 from raidar.schemas.scorecard import (
     ComplianceCheck,
     ComplianceScore,
@@ -10,188 +14,228 @@ from raidar.schemas.scorecard import (
     RunValidityScore,
     Scorecard,
     VisualScore,
+    weighted_quality_score,
+)
+
+_SCORE_TOLERANCE = 1e-3
+
+_ALL_PASS_FUNCTIONAL = FunctionalScore.model_construct(
+    passed=True, build_succeeded=True, tests_passed=10, tests_total=10
 )
 
 
 class TestFunctionalScore:
     """Test FunctionalScore computed fields."""
 
-    def test_score_zero_when_build_fails(self):
-        """Score should be 0 when build fails."""
-        score = FunctionalScore(build_succeeded=False, tests_passed=5, tests_total=5)
-        assert score.score == 0.0
-
-    def test_score_one_when_all_tests_pass(self):
-        """Score should be 1 when all tests pass."""
-        score = FunctionalScore(
-            build_succeeded=True,
-            tests_passed=10,
-            tests_total=10,
-            passed=True,
+    @pytest.mark.parametrize(
+        ("build_succeeded", "tests_passed", "tests_total", "passed", "expected"),
+        [
+            pytest.param(False, 5, 5, False, 0.0, id="build-fails"),
+            pytest.param(True, 10, 10, True, 1.0, id="all-tests-pass"),
+            pytest.param(True, 7, 10, False, 0.7, id="some-tests-fail"),
+            pytest.param(True, 0, 0, True, 1.0, id="no-tests"),
+        ],
+    )
+    def test_score(
+        self,
+        build_succeeded: bool,
+        tests_passed: int,
+        tests_total: int,
+        passed: bool,
+        expected: float,
+    ):
+        """Score should follow build status and the test pass ratio."""
+        score = FunctionalScore.model_construct(
+            build_succeeded=build_succeeded,
+            tests_passed=tests_passed,
+            tests_total=tests_total,
+            passed=passed,
         )
-        assert score.score == 1.0
-
-    def test_score_partial_when_some_tests_fail(self):
-        """Score should be partial when some tests fail."""
-        score = FunctionalScore(
-            build_succeeded=True,
-            tests_passed=7,
-            tests_total=10,
-        )
-        assert score.score == 0.7
-
-    def test_score_one_when_no_tests(self):
-        """Score should be 1 when no tests exist but passed."""
-        score = FunctionalScore(
-            build_succeeded=True,
-            tests_passed=0,
-            tests_total=0,
-            passed=True,
-        )
-        assert score.score == 1.0
+        assert score.score == expected
 
 
 class TestComplianceScore:
     """Test ComplianceScore computed fields."""
 
-    def test_score_one_when_no_checks(self):
-        """Score should be 1 when no checks configured."""
-        score = ComplianceScore(checks=[])
-        assert score.score == 1.0
-
-    def test_score_one_when_all_pass(self):
-        """Score should be 1 when all checks pass."""
-        checks = [
-            ComplianceCheck(rule="Rule 1", type="deterministic", passed=True),
-            ComplianceCheck(rule="Rule 2", type="deterministic", passed=True),
-        ]
-        score = ComplianceScore(checks=checks)
-        assert score.score == 1.0
-
-    def test_score_zero_when_all_fail(self):
-        """Score should be 0 when all checks fail."""
+    @pytest.mark.parametrize(
+        ("passing", "failing", "expected"),
+        [
+            pytest.param(0, 0, 1.0, id="no-checks"),
+            pytest.param(2, 0, 1.0, id="all-pass"),
+            pytest.param(0, 2, 0.0, id="all-fail"),
+            pytest.param(1, 1, 0.5, id="some-fail"),
+        ],
+    )
+    def test_score(self, passing: int, failing: int, expected: float):
+        """Score should be the ratio of passing checks, or 1 with no checks."""
+        outcomes = [True] * passing + [False] * failing
         checks = [
-            ComplianceCheck(rule="Rule 1", type="deterministic", passed=False),
-            ComplianceCheck(rule="Rule 2", type="deterministic", passed=False),
-        ]
-        score = ComplianceScore(checks=checks)
-        assert score.score == 0.0
-
-    def test_score_partial_when_some_fail(self):
-        """Score should be partial when some checks fail."""
-        checks = [
-            ComplianceCheck(rule="Rule 1", type="deterministic", passed=True),
-            ComplianceCheck(rule="Rule 2", type="deterministic", passed=False),
+            ComplianceCheck.model_construct(
+                rule=f"Rule {index}", type="deterministic", passed=outcome
+            )
+            for index, outcome in enumerate(outcomes, start=1)
         ]
-        score = ComplianceScore(checks=checks)
-        assert score.score == 0.5
+        score = ComplianceScore.model_construct(checks=checks)
+        assert score.score == expected
 
 
 class TestEfficiencyScore:
     """Test EfficiencyScore computed fields."""
 
-    def test_score_one_when_no_failures(self):
-        """Score should be 1 when no gate failures."""
-        score = EfficiencyScore(total_gate_failures=0, repeat_failures=0)
-        assert score.score == 1.0
+    @pytest.mark.parametrize(
+        ("total_gate_failures", "repeat_failures", "expected"),
+        [
+            pytest.param(0, 0, 1.0, id="no-failures"),
+            pytest.param(100, 100, 0.0, id="clamped-to-zero"),
+        ],
+    )
+    def test_score_bounds(self, total_gate_failures: int, repeat_failures: int, expected: float):
+        """Score should be 1 without failures and never go below 0."""
+        score = EfficiencyScore.model_construct(
+            total_gate_failures=total_gate_failures, repeat_failures=repeat_failures
+        )
+        assert score.score == expected
 
     def test_score_decreases_with_failures(self):
         """Score should decrease with gate failures."""
-        score = EfficiencyScore(total_gate_failures=2, repeat_failures=0)
+        score = EfficiencyScore.model_construct(total_gate_failures=2, repeat_failures=0)
         assert score.score < 1.0
         assert score.score > 0.0
 
     def test_score_decreases_more_with_repeats(self):
         """Repeat failures should decrease score more."""
-        no_repeat = EfficiencyScore(total_gate_failures=2, repeat_failures=0)
-        with_repeat = EfficiencyScore(total_gate_failures=2, repeat_failures=1)
+        no_repeat = EfficiencyScore.model_construct(total_gate_failures=2, repeat_failures=0)
+        with_repeat = EfficiencyScore.model_construct(total_gate_failures=2, repeat_failures=1)
         assert with_repeat.score < no_repeat.score
 
-    def test_score_clamped_to_zero(self):
-        """Score should not go below 0."""
-        score = EfficiencyScore(total_gate_failures=100, repeat_failures=100)
-        assert score.score == 0.0
-
 
 class TestVisualScore:
     """Test VisualScore computed fields."""
 
     def test_score_equals_similarity(self):
         """Score should equal similarity."""
-        score = VisualScore(similarity=0.85)
+        score = VisualScore.model_construct(similarity=0.85)
         assert score.score == 0.85
 
 
+class TestWeightedQualityScore:
+    """Test quality-dimension weighting."""
+
+    @pytest.mark.parametrize(
+        ("functional", "compliance", "visual", "efficiency", "expected"),
+        [
+            # 0.5*0.4 + 1.0*0.25 + 0.8*0.2 + 1.0*0.15
+            pytest.param(0.5, 1.0, 0.8, 1.0, 0.76, id="with-visual"),
+            # (0.5*0.4 + 1.0*0.25 + 1.0*0.15) / 0.8
+            pytest.param(0.5, 1.0, None, 1.0, 0.75, id="visual-weight-redistributed"),
+            pytest.param(1.0, 1.0, None, 1.0, 1.0, id="all-pass-without-visual"),
+        ],
+    )
+    def test_weighting(
+        self,
+        functional: float,
+        compliance: float,
+        visual: float | None,
+        efficiency: float,
+        expected: float,
+    ):
+        """Weighted score should follow configured weights and redistribute visual."""
+        score = weighted_quality_score(
+            functional=functional,
+            compliance=compliance,
+            visual=visual,
+            efficiency=efficiency,
+        )
+        assert score == pytest.approx(expected, abs=_SCORE_TOLERANCE)
+
+
+def _run_validity(name: str, *, passed: bool, evidence: str) -> RunValidityScore:
+    return RunValidityScore.model_construct(
+        checks=[GateCheck.model_construct(name=name, passed=passed, evidence=evidence)]
+    )
+
+
 class TestScorecardComposite:
     """Test Scorecard composite score calculation."""
 
-    def test_composite_with_visual(self):
-        """Composite should use all weights when visual present."""
-        scorecard = Scorecard(
-            functional=FunctionalScore(
-                passed=True, build_succeeded=True, tests_passed=10, tests_total=10
+    @pytest.mark.parametrize(
+        ("fields", "expected"),
+        [
+            pytest.param(
+                {
+                    "functional": _ALL_PASS_FUNCTIONAL,
+                    "compliance": ComplianceScore.model_construct(),
+                    "visual": VisualScore.model_construct(similarity=1.0),
+                    "efficiency": EfficiencyScore.model_construct(),
+                },
+                1.0,
+                id="with-visual",
             ),
-            compliance=ComplianceScore(),
-            visual=VisualScore(similarity=1.0),
-            efficiency=EfficiencyScore(),
-        )
-        # All scores are 1.0, so composite should be 1.0
-        assert abs(scorecard.composite_score - 1.0) < 0.001
-
-    def test_composite_without_visual(self):
-        """Composite should redistribute visual weight when visual None."""
-        scorecard = Scorecard(
-            functional=FunctionalScore(
-                passed=True, build_succeeded=True, tests_passed=10, tests_total=10
+            pytest.param(
+                {
+                    "functional": _ALL_PASS_FUNCTIONAL,
+                    "compliance": ComplianceScore.model_construct(),
+                    "visual": None,
+                    "efficiency": EfficiencyScore.model_construct(),
+                },
+                1.0,
+                id="without-visual",
             ),
-            compliance=ComplianceScore(),
-            visual=None,
-            efficiency=EfficiencyScore(),
-        )
-        # All scores are 1.0, so composite should still be 1.0
-        assert abs(scorecard.composite_score - 1.0) < 0.001
+            pytest.param(
+                {
+                    "run_validity": _run_validity(
+                        "quality_gates_passed", passed=False, evidence="lint failed"
+                    ),
+                },
+                0.0,
+                id="zero-when-invalid",
+            ),
+            pytest.param(
+                {
+                    "voided": True,
+                    "void_reasons": ["provider_rate_limit"],
+                    "run_validity": _run_validity(
+                        "quality_gates_passed", passed=True, evidence="all gates passed"
+                    ),
+                    "optimization": OptimizationScore.model_construct(
+                        uncached_input_tokens=100,
+                        output_tokens=20,
+                        command_count=2,
+                        failed_command_count=0,
+                        verification_rounds=1,
+                        repeated_verification_failures=0,
+                    ),
+                },
+                0.0,
+                id="zero-when-voided",
+            ),
+        ],
+    )
+    def test_composite_score(self, fields: dict[str, Any], expected: float):
+        """Composite should be gated on validity and voiding, else the optimization score."""
+        scorecard = Scorecard.model_construct(**fields)
+        assert scorecard.composite_score == pytest.approx(expected, abs=_SCORE_TOLERANCE)
 
     def test_composite_with_mixed_scores(self):
         """Quality score should weight quality dimensions correctly."""
-        scorecard = Scorecard(
-            functional=FunctionalScore(
+        scorecard = Scorecard.model_construct(
+            functional=FunctionalScore.model_construct(
                 passed=True, build_succeeded=True, tests_passed=5, tests_total=10
             ),  # 0.5
-            compliance=ComplianceScore(),  # 1.0
-            visual=VisualScore(similarity=0.8),  # 0.8
-            efficiency=EfficiencyScore(),  # 1.0
+            compliance=ComplianceScore.model_construct(),  # 1.0
+            visual=VisualScore.model_construct(similarity=0.8),  # 0.8
+            efficiency=EfficiencyScore.model_construct(),  # 1.0
         )
         # 0.5*0.4 + 1.0*0.25 + 0.8*0.2 + 1.0*0.15 = 0.2 + 0.25 + 0.16 + 0.15 = 0.76
-        assert abs(scorecard.quality_score - 0.76) < 0.001
-
-    def test_composite_zero_when_invalid(self):
-        """Composite score must be 0 when run validity checks fail."""
-        scorecard = Scorecard(
-            run_validity=RunValidityScore(
-                checks=[
-                    GateCheck(
-                        name="quality_gates_passed",
-                        passed=False,
-                        evidence="lint failed",
-                    )
-                ]
-            )
-        )
-        assert scorecard.composite_score == 0.0
+        assert scorecard.quality_score == pytest.approx(0.76, abs=_SCORE_TOLERANCE)
 
     def test_composite_uses_optimization_when_valid(self):
         """Composite score should use optimization score after run validity."""
-        scorecard = Scorecard(
-            run_validity=RunValidityScore(
-                checks=[
-                    GateCheck(
-                        name="quality_gates_passed",
-                        passed=True,
-                        evidence="all gates passed",
-                    )
-                ]
+        scorecard = Scorecard.model_construct(
+            run_validity=_run_validity(
+                "quality_gates_passed", passed=True, evidence="all gates passed"
             ),
-            optimization=OptimizationScore(
+            optimization=OptimizationScore.model_construct(
                 uncached_input_tokens=150000,
                 output_tokens=2000,
                 command_count=8,
@@ -202,43 +246,12 @@ class TestScorecardComposite:
         )
         assert scorecard.composite_score == scorecard.optimization.score
 
-    def test_composite_zero_when_voided(self):
-        """Composite score must be 0 when run is voided."""
-        scorecard = Scorecard(
-            voided=True,
-            void_reasons=["provider_rate_limit"],
-            run_validity=RunValidityScore(
-                checks=[
-                    GateCheck(
-                        name="quality_gates_passed",
-                        passed=True,
-                        evidence="all gates passed",
-                    )
-                ]
-            ),
-            optimization=OptimizationScore(
-                uncached_input_tokens=100,
-                output_tokens=20,
-                command_count=2,
-                failed_command_count=0,
-                verification_rounds=1,
-                repeated_verification_failures=0,
-            ),
-        )
-        assert scorecard.composite_score == 0.0
-
     def test_diagnostic_score_available_when_invalid(self):
         """Diagnostic score should remain available for failed runs."""
-        scorecard = Scorecard(
-            run_validity=RunValidityScore(
-                checks=[
-                    GateCheck(
-                        name="no_requirement_test_gaps",
-                        passed=False,
-                        evidence="mapped=2/4",
-                    )
-                ]
-            )
+        scorecard = Scorecard.model_construct(
+            run_validity=_run_validity(
+                "no_requirement_test_gaps", passed=False, evidence="mapped=2/4"
+            ),
         )
         assert scorecard.composite_score == 0.0
         assert scorecard.diagnostic_score > 0.0
@@ -7,11 +7,8 @@ from raidar.parser.session_log import parse_cursor_session, parse_session
 
 
 def _write_jsonl(tmp_dir: Path, name: str, lines: list[dict]) -> None:
-    file_path = tmp_dir / name
-    with file_path.open("w") as f:
-        for entry in lines:
-            f.write(json.dumps(entry))
-            f.write("\n")
+    payload = "".join(f"{json.dumps(entry)}\n" for entry in lines)
+    (tmp_dir / name).write_bytes(payload.encode())
 
 
 def _write_json(tmp_dir: Path, name: str, payload: list[dict]) -> None:
@@ -3,7 +3,13 @@
 from datetime import UTC, datetime
 from pathlib import Path
 
-from raidar.schemas.scorecard import EvalConfig, EvalRun, Scorecard
+from raidar.schemas.scorecard import (
+    EvalConfig,
+    EvalRun,
+    PerformanceGatesScore,
+    RunValidityScore,
+    Scorecard,
+)
 from raidar.storage import (
     aggregate_results,
     load_all_runs,
@@ -11,6 +17,15 @@ from raidar.storage import (
     save_run,
 )
 
+_DEFAULT_CONFIG = EvalConfig(
+    model="openai/gpt-4o",
+    harness="codex-cli",
+    task_name="test",
+    task_version="v001",
+    scaffold_root="scaffold",
+)
+_DEFAULT_SCORES = Scorecard()  # Shared templates: give each run its own model_copy().
+
 
 class TestSaveAndLoadRun:
     """Test run persistence."""
@@ -114,31 +129,15 @@ class TestAggregateResults:
 
     def test_calculates_average_score(self):
         """Should calculate average scores correctly."""
-        run1 = EvalRun(
-            id="run-001",
-            timestamp=datetime.now(UTC).isoformat(),
-            config=EvalConfig(
-                model="openai/gpt-4o",
-                harness="codex-cli",
-                task_name="test",
-                task_version="v001",
-                scaffold_root="scaffold",
-            ),
-            duration_sec=60,
-            scores=Scorecard(),
-        )
-        run2 = EvalRun(
-            id="run-002",
-            timestamp=datetime.now(UTC).isoformat(),
-            config=EvalConfig(
-                model="openai/gpt-4o",
-                harness="codex-cli",
-                task_name="test",
-                task_version="v001",
-                scaffold_root="scaffold",
-            ),
-            duration_sec=60,
-            scores=Scorecard(),
+        run1, run2 = (
+            EvalRun(
+                id=run_id,
+                timestamp=datetime.now(UTC).isoformat(),
+                config=_DEFAULT_CONFIG.model_copy(),
+                duration_sec=60,
+                scores=_DEFAULT_SCORES.model_copy(deep=True),
+            )
+            for run_id in ("run-001", "run-002")
         )
 
         result = aggregate_results([run1, run2])
@@ -149,18 +148,18 @@ class TestAggregateResults:
 
     def test_void_runs_excluded_from_scored_aggregates(self, sample_eval_run: EvalRun):
         """Void runs should not affect scored validity-rate/average."""
-        valid = sample_eval_run.model_copy(deep=True)
-        valid.id = "valid-run"
-        valid.scores.voided = False
-        valid.scores.run_validity.checks = []
-        valid.scores.performance_gates.checks = []
-
-        voided = sample_eval_run.model_copy(deep=True)
-        voided.id = "void-run"
-        voided.scores.voided = True
-        voided.scores.void_reasons = ["provider_rate_limit"]
-        voided.scores.run_validity.checks = []
-        voided.scores.performance_gates.checks = []
+        # Shallow copies: only the replaced fields differ, the rest is read-only here.
+        no_gate_checks = {
+            "run_validity": RunValidityScore(),
+            "performance_gates": PerformanceGatesScore(),
+        }
+        valid_scores = sample_eval_run.scores.model_copy(update={"voided": False, **no_gate_checks})
+        valid = sample_eval_run.model_copy(update={"id": "valid-run", "scores": valid_scores})
+
+        void_scores = sample_eval_run.scores.model_copy(
+            update={"voided": True, "void_reasons": ["provider_rate_limit"], **no_gate_checks}
+        )
+        voided = sample_eval_run.model_copy(update={"id": "void-run", "scores": void_scores})
 
         result = aggregate_results([valid, voided])
         stats = result["by_harness"][valid.config.harness]
@@ -1,10 +1,17 @@
 """Regression tests for visual and functional scoring edge cases."""
 
 from pathlib import Path
+from types import SimpleNamespace
 
 from raidar.scoring import functional
 from raidar.scoring.visual import compare_images
 
+_ODIFF_DIFF_RESULT = SimpleNamespace(
+    returncode=22,
+    stdout="Different pixels: 46402 (3.580401%)",
+    stderr="",
+)
+
 
 def test_run_tests_passes_when_no_tests_found(monkeypatch):
     """No-test suites should be treated as pass with zero counts."""
@@ -23,20 +30,14 @@ def test_run_tests_passes_when_no_tests_found(monkeypatch):
 
 def test_compare_images_parses_diff_percent_from_nonzero_exit(monkeypatch, tmp_path):
     """Odiff diff exits are non-zero and must still produce similarity."""
-
-    class FakeResult:
-        returncode = 22
-        stdout = "Different pixels: 46402 (3.580401%)"
-        stderr = ""
-
     reference = tmp_path / "reference.png"
     actual = tmp_path / "actual.png"
     diff = tmp_path / "diff.png"
-    reference.write_bytes(b"ref")
-    actual.write_bytes(b"actual")
-    diff.write_bytes(b"diff")
+    # compare_images only checks that these exist; odiff itself is faked.
+    for image in (reference, actual, diff):
+        image.touch()
 
-    monkeypatch.setattr("raidar.scoring.visual.subprocess.run", lambda *a, **k: FakeResult())
+    monkeypatch.setattr("raidar.scoring.visual.subprocess.run", lambda *a, **k: _ODIFF_DIFF_RESULT)
 
     similarity, diff_path = compare_images(
         workspace=tmp_path,
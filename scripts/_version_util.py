@@ -0,0 +1,19 @@
+"""Shared helpers for the version maintenance scripts."""
+
+from __future__ import annotations
+
+import tomllib
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+PYPROJECT_PATH = REPO_ROOT / "orchestrator" / "pyproject.toml"
+
+
+def current_project_version(path: Path = PYPROJECT_PATH) -> str:
+    """Read [project].version from the orchestrator pyproject.toml."""
+    with path.open("rb") as handle:
+        data = tomllib.load(handle)
+    version = data.get("project", {}).get("version")
+    if not isinstance(version, str) or not version:
+        raise ValueError(f"Missing [project].version in {path}")
+    return version
@@ -16,14 +16,16 @@ import argparse
 import re
 import subprocess
 from datetime import UTC, datetime
-from pathlib import Path
 
-REPO_ROOT = Path(__file__).resolve().parents[1]
-PYPROJECT_PATH = REPO_ROOT / "orchestrator" / "pyproject.toml"
+from _version_util import PYPROJECT_PATH, REPO_ROOT, current_project_version
+
 CHANGELOG_PATH = REPO_ROOT / "CHANGELOG.md"
 
 VERSION_PATTERN = re.compile(r'^version\s*=\s*"(\d+\.\d+\.\d+)"', re.MULTILINE)
-COMMIT_TYPE_PATTERN = re.compile(r"^(\w+)(?:\(.+\))?:\s*(.+)$")
+COMMIT_TYPE_PATTERN = re.compile(r"^(?P<type>\w+)(?:\(.+\))?(?P<breaking>!)?:\s*(?P<subject>.+)$")
+BREAKING_CHANGE_PATTERN = re.compile(r"BREAKING CHANGE", re.IGNORECASE)
+
+RELEASE_COMMIT_PREFIXES = ("chore: bump version", "chore(release):")
 
 BUMP_TYPES = {
     "feat": "minor",
@@ -31,14 +33,25 @@ BUMP_TYPES = {
     "perf": "patch",
 }
 
+CHANGELOG_TYPE_ORDER = (
+    "feat",
+    "fix",
+    "perf",
+    "refactor",
+    "docs",
+    "ci",
+    "build",
+    "style",
+    "chore",
+    "test",
+    "other",
+)
+TYPE_RANK = {commit_type: rank for rank, commit_type in enumerate(CHANGELOG_TYPE_ORDER)}
+
 
 def get_current_version() -> str:
     """Read current version from orchestrator pyproject.toml."""
-    content = PYPROJECT_PATH.read_text(encoding="utf-8")
-    match = VERSION_PATTERN.search(content)
-    if not match:
-        raise ValueError(f"Could not find version in {PYPROJECT_PATH}")
-    return match.group(1)
+    return current_project_version()
 
 
 def parse_version(version: str) -> tuple[int, int, int]:
@@ -59,11 +72,12 @@ def get_commits_since_last_bump() -> list[str]:
         cwd=REPO_ROOT,
         check=True,
     )
-    commits = [line for line in result.stdout.strip().split("\n") if line]
 
     filtered: list[str] = []
-    for commit in commits:
-        if commit.startswith("chore: bump version") or commit.startswith("chore(release):"):
+    for commit in result.stdout.splitlines():
+        if not commit:
+            continue
+        if commit.startswith(RELEASE_COMMIT_PREFIXES):
             break
         filtered.append(commit)
     return filtered
@@ -75,12 +89,12 @@ def analyze_commits(commits: list[str]) -> tuple[str, list[dict[str, str]]]:
     categorized: list[dict[str, str]] = []
 
     for commit in commits:
-        if "BREAKING CHANGE" in commit.upper():
+        match = COMMIT_TYPE_PATTERN.match(commit)
+        if (match and match.group("breaking")) or BREAKING_CHANGE_PATTERN.search(commit):
             bump_type = "major"
 
-        match = COMMIT_TYPE_PATTERN.match(commit)
         if match:
-            commit_type = match.group(1).lower()
+            commit_type = match.group("type").lower()
             categorized.append({"type": commit_type, "raw": commit})
 
             if commit_type in BUMP_TYPES:
@@ -113,35 +127,19 @@ def update_pyproject(new_version: str) -> None:
 
 
 def generate_changelog_entry(version: str, commits: list[dict[str, str]]) -> str:
-    today = datetime.now(UTC).strftime("%Y-%m-%d")
+    today = datetime.now(UTC).date().isoformat()
     lines = [f"## [{version}] - {today}", ""]
 
-    type_order = [
-        "feat",
-        "fix",
-        "perf",
-        "refactor",
-        "docs",
-        "ci",
-        "build",
-        "style",
-        "chore",
-        "test",
-        "other",
-    ]
     by_type: dict[str, list[str]] = {}
 
     for commit in commits:
         key = commit["type"]
         by_type.setdefault(key, []).append(commit["raw"])
 
-    for kind in type_order:
-        for raw in by_type.get(kind, []):
-            lines.append(f"- {raw}")
-
-    for kind in sorted(set(by_type) - set(type_order)):
-        for raw in by_type[kind]:
-            lines.append(f"- {raw}")
+    unranked = len(TYPE_RANK)
+    ordered = sorted(by_type.items(), key=lambda item: (TYPE_RANK.get(item[0], unranked), item[0]))
+    for _, raws in ordered:
+        lines.extend(f"- {raw}" for raw in raws)
 
     lines.append("")
     return "\n".join(lines)
@@ -152,7 +150,7 @@ def update_changelog(entry: str) -> None:
     header_end = content.find("\n## ")
     if header_end == -1:
         header_end = content.find("\n\n") + 1
-    updated = content[:header_end] + "\n" + entry + content[header_end:]
+    updated = "".join((content[:header_end], "\n", entry, content[header_end:]))
     CHANGELOG_PATH.write_text(updated, encoding="utf-8")
 
 